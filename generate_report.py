@@ -2,1033 +2,636 @@
 """
 Active Directory Security Audit Report Generator
 Processes JSON audit data and generates HTML report with risk scoring
+
+Performance notes:
+    Report generation is bound by Python object allocation (dict lookups and
+    string building over heterogeneous AD records), not by numeric work, so
+    NumPy/Numba do not help here. The speedups come from the precompiled page
+    template, single-pass account classification and streamed output. The
+    module also type-checks cleanly and can be compiled with mypyc.
 """
 
+import io
 import json
+import os
+import re
 import sys
 import argparse
+import heapq
+from array import array
+from collections import Counter
 from datetime import datetime, timedelta
+from functools import lru_cache, wraps
+from itertools import chain, islice
+from html import escape
 from pathlib import Path
-from typing import Dict, List, Any
-
-# HTML Template with local libraries
-HTML_TEMPLATE = """<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Active Directory Security Audit Report</title>
-    <script src="libs/chart.umd.min.js"></script>
-    <script type="text/javascript" src="libs/vis-network.min.js"></script>
-    <style>
-        * {{
-            margin: 0;
-            padding: 0;
-            box-sizing: border-box;
-        }}
-        
-        body {{
-            font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', 'Roboto', 'Helvetica Neue', Arial, sans-serif;
-            background: #f8f9fa;
-            color: #212529;
-            line-height: 1.6;
-            font-size: 14px;
-        }}
-        
-        .container {{
-            max-width: 1600px;
-            margin: 0 auto;
-            padding: 0;
-            background: #ffffff;
-            box-shadow: 0 0 1px rgba(0,0,0,0.1);
-        }}
-        
-        header {{
-            background: #8b1a1a;
-            color: #ffffff;
-            padding: 40px 50px;
-            border-bottom: 4px solid #a02020;
-        }}
-        
-        header h1 {{
-            font-size: 28px;
-            font-weight: 600;
-            margin-bottom: 12px;
-            letter-spacing: -0.5px;
-        }}
-        
-        .meta-info {{
-            display: flex;
-            gap: 30px;
-            margin-top: 16px;
-            font-size: 13px;
-            color: #f5c2c7;
-            flex-wrap: wrap;
-        }}
-        
-        .meta-info span {{
-            display: flex;
-            align-items: center;
-            gap: 6px;
-        }}
-        
-        .meta-info strong {{
-            color: #ffffff;
-            font-weight: 600;
-        }}
-        
-        .dashboard {{
-            display: grid;
-            grid-template-columns: repeat(auto-fit, minmax(220px, 1fr));
-            gap: 0;
-            border-bottom: 1px solid #e9ecef;
-        }}
-        
-        .card {{
-            background: #ffffff;
-            padding: 24px 28px;
-            border-right: 1px solid #e9ecef;
-            border-bottom: 1px solid #e9ecef;
-            transition: background-color 0.15s ease;
-        }}
-        
-        .card:last-child {{
-            border-right: none;
-        }}
-        
-        .card:hover {{
-            background: #f8f9fa;
-        }}
-        
-        .card h3 {{
-            color: #6c757d;
-            margin-bottom: 12px;
-            font-size: 12px;
-            font-weight: 600;
-            text-transform: uppercase;
-            letter-spacing: 0.5px;
-        }}
-        
-        .card .value {{
-            font-size: 32px;
-            font-weight: 700;
-            color: #212529;
-            line-height: 1.2;
-            margin-bottom: 8px;
-        }}
-        
-        .risk-score {{
-            display: inline-block;
-            padding: 4px 12px;
-            border-radius: 3px;
-            font-weight: 600;
-            font-size: 11px;
-            text-transform: uppercase;
-            letter-spacing: 0.5px;
-        }}
-        
-        .risk-low {{
-            background: #d1e7dd;
-            color: #0f5132;
-            border: 1px solid #badbcc;
-        }}
-        
-        .risk-medium {{
-            background: #fff3cd;
-            color: #664d03;
-            border: 1px solid #ffecb5;
-        }}
-        
-        .risk-high {{
-            background: #f8d7da;
-            color: #842029;
-            border: 1px solid #f5c2c7;
-        }}
-        
-        .section {{
-            background: #ffffff;
-            border-bottom: 1px solid #e9ecef;
-            margin-bottom: 0;
-        }}
-        
-        .section-header {{
-            padding: 20px 50px;
-            background: #f8f9fa;
-            border-bottom: 1px solid #e9ecef;
-            cursor: pointer;
-            display: flex;
-            justify-content: space-between;
-            align-items: center;
-            transition: background-color 0.15s ease;
-        }}
-        
-        .section-header:hover {{
-            background: #e9ecef;
-        }}
-        
-        .section h2 {{
-            color: #212529;
-            font-size: 16px;
-            font-weight: 600;
-            margin: 0;
-            display: flex;
-            align-items: center;
-            gap: 10px;
-        }}
-        
-        .section-icon {{
-            font-size: 18px;
-            opacity: 0.7;
-        }}
-        
-        .section-toggle {{
-            color: #6c757d;
-            font-size: 12px;
-            font-weight: 400;
-            transition: transform 0.2s ease;
-        }}
-        
-        .section.collapsed .section-toggle {{
-            transform: rotate(-90deg);
-        }}
-        
-        .section-content {{
-            padding: 30px 50px;
-            overflow: hidden;
-            transition: max-height 0.3s ease-out, padding 0.3s ease-out;
-        }}
-        
-        .section.collapsed .section-content {{
-            max-height: 0;
-            padding-top: 0;
-            padding-bottom: 0;
-            overflow: hidden;
-        }}
-        
-        table {{
-            width: 100%;
-            border-collapse: separate;
-            border-spacing: 0;
-            margin-top: 0;
-            font-size: 13px;
-        }}
-        
-        th {{
-            background: #f8f9fa;
-            color: #495057;
-            padding: 12px 14px;
-            text-align: left;
-            font-weight: 600;
-            font-size: 12px;
-            text-transform: uppercase;
-            letter-spacing: 0.5px;
-            border-bottom: 2px solid #dee2e6;
-            position: sticky;
-            top: 0;
-            z-index: 10;
-        }}
-        
-        td {{
-            padding: 12px 14px;
-            border-bottom: 1px solid #e9ecef;
-            color: #212529;
-        }}
-        
-        tbody tr {{
-            transition: background-color 0.1s ease;
-        }}
-        
-        tbody tr:hover {{
-            background: #f8f9fa;
-        }}
-        
-        tbody tr:last-child td {{
-            border-bottom: none;
-        }}
-        
-        .badge {{
-            display: inline-block;
-            padding: 3px 8px;
-            border-radius: 2px;
-            font-size: 11px;
-            font-weight: 600;
-            margin: 1px 2px;
-            text-transform: uppercase;
-            letter-spacing: 0.3px;
-            border: 1px solid transparent;
-        }}
-        
-        .badge-red {{
-            background: #f8d7da;
-            color: #721c24;
-            border-color: #f5c2c7;
-        }}
-        
-        .badge-yellow {{
-            background: #fff3cd;
-            color: #856404;
-            border-color: #ffecb5;
-        }}
-        
-        .badge-green {{
-            background: #d1e7dd;
-            color: #0f5132;
-            border-color: #badbcc;
-        }}
-        
-        .badge-blue {{
-            background: #f8d7da;
-            color: #721c24;
-            border-color: #f5c2c7;
-        }}
-        
-        .badge-gray {{
-            background: #e9ecef;
-            color: #495057;
-            border-color: #dee2e6;
-        }}
-        
-        .alert {{
-            padding: 16px 20px;
-            margin: 20px 0;
-            border-left: 4px solid;
-            border-radius: 0;
-            background: #f8f9fa;
-            font-size: 13px;
-        }}
-        
-        .alert-warning {{
-            border-left-color: #ffc107;
-            background: #fffbf0;
-            color: #856404;
-        }}
-        
-        .alert-danger {{
-            border-left-color: #dc3545;
-            background: #fff5f5;
-            color: #721c24;
-        }}
-        
-        .alert-info {{
-            border-left-color: #0dcaf0;
-            background: #f0f9ff;
-            color: #055160;
-        }}
-        
-        .recommendations {{
-            background: #f8f9fa;
-            border-left: 4px solid #dc3545;
-            padding: 24px 28px;
-            margin: 0;
-        }}
-        
-        .recommendations h3 {{
-            color: #dc3545;
-            margin-bottom: 16px;
-            font-size: 15px;
-            font-weight: 600;
-        }}
-        
-        .recommendations ul {{
-            margin-left: 20px;
-            list-style: none;
-        }}
-        
-        .recommendations li {{
-            margin-bottom: 12px;
-            padding-left: 24px;
-            position: relative;
-            font-size: 13px;
-            line-height: 1.6;
-            color: #495057;
-        }}
-        
-        .recommendations li::before {{
-            content: "→";
-            position: absolute;
-            left: 0;
-            color: #dc3545;
-            font-weight: bold;
-        }}
-        
-        .recommendations li strong {{
-            color: #212529;
-            font-weight: 600;
-        }}
-        
-        .summary-stats {{
-            display: grid;
-            grid-template-columns: repeat(auto-fit, minmax(180px, 1fr));
-            gap: 20px;
-            margin: 24px 0;
-        }}
-        
-        .stat-item {{
-            padding: 20px;
-            background: #f8f9fa;
-            border: 1px solid #e9ecef;
-            border-radius: 0;
-        }}
-        
-        .stat-item .label {{
-            font-size: 11px;
-            color: #6c757d;
-            margin-bottom: 8px;
-            text-transform: uppercase;
-            letter-spacing: 0.5px;
-            font-weight: 600;
-        }}
-        
-        .stat-item .number {{
-            font-size: 24px;
-            font-weight: 700;
-            color: #212529;
-        }}
-        
-        .footer {{
-            background: #f8f9fa;
-            padding: 24px 50px;
-            border-top: 1px solid #e9ecef;
-            text-align: center;
-            font-size: 12px;
-            color: #6c757d;
-        }}
-        
-        #graph-container {{
-            width: 100%;
-            height: 800px;
-            border: 1px solid #dee2e6;
-            background: #ffffff;
-            margin: 20px 0;
-        }}
-        
-        .graph-controls {{
-            display: flex;
-            gap: 10px;
-            margin-bottom: 15px;
-            flex-wrap: wrap;
-        }}
-        
-        .graph-controls button {{
-            padding: 8px 16px;
-            background: #dc3545;
-            color: white;
-            border: none;
-            border-radius: 3px;
-            cursor: pointer;
-            font-size: 12px;
-            font-weight: 600;
-            transition: background-color 0.2s;
-        }}
-        
-        .graph-controls button:hover {{
-            background: #c82333;
-        }}
-        
-        .graph-controls button.active {{
-            background: #a02020;
-        }}
-        
-        .graph-legend {{
-            display: flex;
-            gap: 20px;
-            margin-top: 15px;
-            flex-wrap: wrap;
-            font-size: 12px;
-        }}
-        
-        .legend-item {{
-            display: flex;
-            align-items: center;
-            gap: 8px;
-        }}
-        
-        .legend-color {{
-            width: 20px;
-            height: 20px;
-            border-radius: 50%;
-            border: 2px solid #dee2e6;
-        }}
-        
-        .node-info-panel {{
-            position: fixed;
-            top: 50%;
-            right: 20px;
-            transform: translateY(-50%);
-            background: white;
-            border: 1px solid #dee2e6;
-            padding: 20px;
-            border-radius: 4px;
-            box-shadow: 0 4px 12px rgba(0,0,0,0.15);
-            font-size: 13px;
-            max-width: 350px;
-            z-index: 1000;
-            display: none;
-        }}
-        
-        .node-info-panel.visible {{
-            display: block;
-        }}
-        
-        .node-info-panel h3 {{
-            margin: 0 0 12px 0;
-            color: #212529;
-            font-size: 16px;
-            border-bottom: 2px solid #dee2e6;
-            padding-bottom: 8px;
-        }}
-        
-        .node-info-panel .info-row {{
-            margin: 8px 0;
-            display: flex;
-            justify-content: space-between;
-        }}
-        
-        .node-info-panel .info-label {{
-            font-weight: 600;
-            color: #6c757d;
-        }}
-        
-        .node-info-panel .info-value {{
-            color: #212529;
-        }}
-        
-        .node-info-panel .close-btn {{
-            position: absolute;
-            top: 10px;
-            right: 10px;
-            background: none;
-            border: none;
-            font-size: 20px;
-            cursor: pointer;
-            color: #6c757d;
-            padding: 0;
-            width: 24px;
-            height: 24px;
-            line-height: 24px;
-        }}
-        
-        .node-info-panel .close-btn:hover {{
-            color: #212529;
-        }}
-        
-        @media print {{
-            /* Reset margins and padding for print */
-            * {{
-                margin: 0;
-                padding: 0;
-            }}
-            
-            body {{
-                background: white;
-                color: black;
-                font-size: 10pt;
-                line-height: 1.4;
-            }}
-            
-            .container {{
-                max-width: 100%;
-                padding: 0;
-                margin: 0;
-            }}
-            
-            /* Header styling for print */
-            header {{
-                background: white !important;
-                color: black !important;
-                border-bottom: 2px solid black;
-                padding: 15px 20px;
-                page-break-after: avoid;
-            }}
-            
-            header h1 {{
-                color: black !important;
-                font-size: 18pt;
-            }}
-            
-            /* Dashboard - make it compact */
-            .dashboard {{
-                display: grid;
-                grid-template-columns: repeat(4, 1fr);
-                gap: 10px;
-                margin: 15px 0;
-                page-break-inside: avoid;
-            }}
-            
-            .card {{
-                background: white !important;
-                border: 1px solid #000 !important;
-                padding: 10px;
-                page-break-inside: avoid;
-            }}
-            
-            .card h3 {{
-                font-size: 9pt;
-                margin-bottom: 5px;
-            }}
-            
-            .card .value {{
-                font-size: 16pt;
-                color: black !important;
-            }}
-            
-            /* Sections */
-            .section {{
-                page-break-inside: avoid;
-                margin-bottom: 15px;
-            }}
-            
-            .section-header {{
-                cursor: default;
-                background: #f0f0f0 !important;
-                color: black !important;
-                border: 1px solid #000;
-                padding: 8px 15px;
-                page-break-after: avoid;
-            }}
-            
-            .section-header h2 {{
-                color: black !important;
-                font-size: 12pt;
-            }}
-            
-            .section-toggle {{
-                display: none;
-            }}
-            
-            .section-icon {{
-                display: none;
-            }}
-            
-            .section.collapsed .section-content {{
-                max-height: none;
-                padding: 15px 20px;
-                display: block !important;
-            }}
-            
-            .section-content {{
-                display: block !important;
-            }}
-            
-            /* Tables */
-            .table-container {{
-                overflow: visible;
-            }}
-            
-            table {{
-                width: 100%;
-                border-collapse: collapse;
-                font-size: 8pt;
-                page-break-inside: auto;
-            }}
-            
-            table thead {{
-                display: table-header-group;
-                background: #f0f0f0 !important;
-            }}
-            
-            table tbody {{
-                display: table-row-group;
-            }}
-            
-            table tr {{
-                page-break-inside: avoid;
-                page-break-after: auto;
-            }}
-            
-            table th, table td {{
-                border: 1px solid #000 !important;
-                padding: 4px 6px;
-                color: black !important;
-            }}
-            
-            table th {{
-                background: #e0e0e0 !important;
-                color: black !important;
-                font-weight: bold;
-            }}
-            
-            /* Badges - convert to text */
-            .badge {{
-                border: 1px solid #000 !important;
-                background: white !important;
-                color: black !important;
-                padding: 2px 6px;
-                font-size: 7pt;
-            }}
-            
-            .badge-red, .badge-yellow, .badge-green, .badge-gray {{
-                background: white !important;
-                color: black !important;
-                border: 1px solid #000 !important;
-            }}
-            
-            /* Alerts */
-            .alert {{
-                border: 1px solid #000 !important;
-                background: white !important;
-                color: black !important;
-                padding: 10px;
-                margin: 10px 0;
-            }}
-            
-            .alert-warning {{
-                border-left: 4px solid #000 !important;
-            }}
-            
-            .alert-info {{
-                border-left: 4px solid #000 !important;
-            }}
-            
-            /* Graph - hide or show static version */
-            #graph-container {{
-                display: none !important;
-            }}
-            
-            .graph-controls {{
-                display: none !important;
-            }}
-            
-            .graph-legend {{
-                display: none !important;
-            }}
-            
-            .node-info-panel {{
-                display: none !important;
-            }}
-            
-            /* Hide interactive elements (except print button shows in print preview) */
-            button:not(:focus) {{
-                display: none !important;
-            }}
-            
-            .graph-filter-btn {{
-                display: none !important;
-            }}
-            
-            /* Summary stats */
-            .summary-stats {{
-                display: grid;
-                grid-template-columns: repeat(3, 1fr);
-                gap: 10px;
-                margin: 10px 0;
-            }}
-            
-            .stat-item {{
-                border: 1px solid #000;
-                padding: 8px;
-                background: white !important;
-            }}
-            
-            /* Footer */
-            .footer {{
-                background: white !important;
-                color: black !important;
-                border-top: 1px solid #000;
-                padding: 10px;
-                margin-top: 20px;
-                page-break-inside: avoid;
-            }}
-            
-            /* Page breaks */
-            .section:not(:last-child) {{
-                page-break-after: auto;
-            }}
-            
-            h2, h3 {{
-                page-break-after: avoid;
-            }}
-            
-            /* Risk scores - ensure readable */
-            .risk-score {{
-                color: black !important;
-                border: 1px solid #000 !important;
-                background: white !important;
-            }}
-            
-            /* Recommendations */
-            .recommendations {{
-                page-break-inside: avoid;
-            }}
-            
-            /* Remove shadows and effects */
-            * {{
-                box-shadow: none !important;
-                text-shadow: none !important;
-            }}
-        }}
-    </style>
-</head>
-<body>
-    <div class="container">
-        <header>
-            <div style="display: flex; justify-content: space-between; align-items: center; margin-bottom: 10px;">
-                <h1>Active Directory Security Audit Report</h1>
-                <button onclick="window.print()" style="background: #dc3545; color: white; border: none; padding: 10px 20px; border-radius: 4px; cursor: pointer; font-size: 14px; font-weight: 600; box-shadow: 0 2px 4px rgba(0,0,0,0.1); transition: background-color 0.2s;" onmouseover="this.style.background='#c82333'" onmouseout="this.style.background='#dc3545'">🖨️ Print Report</button>
-            </div>
-            <div class="meta-info">
-                <span><strong>Domain:</strong> {domain}</span>
-                <span><strong>Generated:</strong> {timestamp}</span>
-                <span><strong>Report Version:</strong> 1.0</span>
-            </div>
-        </header>
-        
-        <div class="dashboard">
-            <div class="card">
-                <h3>Overall Risk Score</h3>
-                <div class="value">{overall_risk_score}</div>
-                <span class="risk-score {overall_risk_class}">{overall_risk_label}</span>
-            </div>
-            <div class="card">
-                <h3>Total Users</h3>
-                <div class="value">{total_users}</div>
-            </div>
-            <div class="card">
-                <h3>Total Computers</h3>
-                <div class="value">{total_computers}</div>
-            </div>
-            <div class="card">
-                <h3>Kerberoast Targets</h3>
-                <div class="value">{kerberoast_targets}</div>
-            </div>
-            <div class="card">
-                <h3>Delegation Risks</h3>
-                <div class="value">{delegation_risks}</div>
-            </div>
-            <div class="card">
-                <h3>Weak Encryption</h3>
-                <div class="value">{weak_encryption}</div>
-            </div>
-            <div class="card">
-                <h3>Computers Checked</h3>
-                <div class="value">{computers_checked}</div>
-            </div>
-        </div>
-        
-        {sections}
-        
+from typing import Dict, List, Any, Callable, FrozenSet, Iterable, Iterator, Optional, Set, TextIO, Tuple
+
+BASE_DIR = Path(__file__).resolve().parent
+LIBS_DIR = BASE_DIR / 'libs'
+
+# HTML page shell with local libraries; static CSS/JS live in libs/report.css and
+# libs/report.js and are linked or inlined via $styles/$scripts (placeholders use $name)
+TEMPLATE_PATH = BASE_DIR / 'report_template.html'
+
+# Write buffer for the report and export files (--io-buffer-size); smaller values are raised to the minimum
+IO_BUFFER_SIZE = 1024 * 1024
+MIN_IO_BUFFER_SIZE = 64 * 1024
+
+
+def _minify_css(css: str) -> str:
+    """Strip comments and insignificant whitespace from a stylesheet"""
+    css = re.sub(r'/\*.*?\*/', '', css, flags=re.S)
+    css = re.sub(r'\s+', ' ', css)
+    css = re.sub(r'\s*([{};,>])\s*', r'\1', css)
+    css = re.sub(r':\s+', ':', css)
+    return css.replace(';}', '}').strip()
+
+
+def _minify_js(js: str) -> str:
+    """Drop indentation, blank lines and whole-line comments from a script"""
+    lines = (line.strip() for line in js.splitlines())
+    return '\n'.join(line for line in lines if line and not line.startswith('//'))
+
+
+@lru_cache(maxsize=None)
+def load_asset(name: str) -> str:
+    """Read a static asset from libs/, minified unless REDSPN_DEBUG is set"""
+    text = (LIBS_DIR / name).read_text(encoding='utf-8')
+    if os.environ.get('REDSPN_DEBUG'):
+        return text
+    if name.endswith('.css'):
+        return _minify_css(text)
+    if name.endswith('.js'):
+        return _minify_js(text)
+    return text
+
+
+@lru_cache(maxsize=None)
+def load_template() -> str:
+    """Read the report page template (once per process)"""
+    return TEMPLATE_PATH.read_text(encoding='utf-8')
+
+
+@lru_cache(maxsize=None)
+def _template_parts() -> Tuple[List[str], List[str]]:
+    """Split the report template into literal chunks and placeholder names.
+
+    Cached so every report rendered in the same process reuses one split and
+    rendering is a single join instead of a scan over the whole template.
+    """
+    parts = re.split(r'\$(\w+)', load_template())
+    return parts[0::2], parts[1::2]
+
+
+def iter_template(context: Dict[str, Any]) -> Iterator[str]:
+    """Yield report template chunks with values from context.
+
+    A value may be a string, a number, or an iterable of string chunks that
+    is streamed in place (used for the large sections body).
+    """
+    literals, keys = _template_parts()
+    for literal, key in zip(literals, keys):
+        yield literal
+        value = context[key]
+        if isinstance(value, (str, int, float)):
+            yield str(value)
+        else:
+            yield from value
+    yield literals[-1]
+
+
+@lru_cache(maxsize=8192, typed=True)
+def _esc_cached(value: Any) -> str:
+    return escape(str(value))
+
+
+def esc(value: Any) -> str:
+    """HTML-escape a value taken from the audit data.
+
+    Names, hosts and IPs repeat across rows, so hashable values are escaped
+    once and served from a cache afterwards.
+    """
+    try:
+        return _esc_cached(value)
+    except TypeError:
+        return escape(str(value))
+
+
+def join_truncated(items: Iterable[str], limit: int, sep: str = ', ') -> str:
+    """Return sep.join(items)[:limit] without joining items past the limit"""
+    parts = []
+    size = -len(sep)
+    for item in items or ():
+        parts.append(item)
+        size += len(sep) + len(item)
+        if size >= limit:
+            break
+    return sep.join(parts)[:limit]
+
+
+def count_rows(counts: Iterable[Tuple[Any, int]]) -> str:
+    """Table rows for (label, count) pairs from Counter.most_common()"""
+    # A list comprehension, not a generator: str.join() builds a list from generators first
+    return ''.join([f'<tr><td>{esc(label)}</td><td>{count}</td></tr>' for label, count in counts])
+
+
+def fmt_member_of(groups: Optional[List[str]]) -> str:
+    """First three group names, with a count of the rest"""
+    if not groups:
+        return 'None'
+    extra = len(groups) - 3
+    return ', '.join(groups[:3]) + (f" (+{extra} more)" if extra > 0 else '')
+
+
+def to_js(value: Any) -> str:
+    """Serialize value as a compact JSON literal for an inline script"""
+    return json.dumps(value, separators=(',', ':'))
+
+
+def to_columns(records: Iterable[Dict[str, Any]]) -> List[List[Any]]:
+    """Pack dicts as [keys, rows] blocks, one per run of records with the same keys.
+
+    Graph records repeat the same handful of keys thousands of times, so
+    sending each key once per run keeps the embedded JSON small. Record order
+    is preserved; the report script expands the blocks back into objects.
+    """
+    blocks: List[List[Any]] = []
+    keys = None
+    rows: List[List[Any]] = []
+    for record in records:
+        record_keys = tuple(record)
+        if record_keys != keys:
+            keys = record_keys
+            rows = []
+            blocks.append([list(keys), rows])
+        rows.append(list(record.values()))
+    return blocks
+
+
+def to_js_parsed(value: Any) -> str:
+    """JS expression that JSON.parse()s value; browsers parse large JSON strings
+    faster than the equivalent object literal"""
+    # '<\/' keeps a '</script>' inside the data from closing the inline script
+    literal = json.dumps(to_js(value)).replace('</', '<\\/')
+    return f'JSON.parse({literal})'
+
+
+def render_template(context: Dict[str, Any]) -> str:
+    """Render the report template with values from context"""
+    return ''.join(iter_template(context))
+
+
+# Pre-rendered badges for the (color, label) pairs used in per-row table cells,
+# so large tables reuse one string per badge instead of formatting it per row
+BADGE_HTML = {
+    (color, label): f'<span class="badge badge-{color}">{label}</span>'
+    for color, label in [
+        ('red', 'SPN'), ('red', 'DA'), ('red', 'EA'), ('green', 'Protected'),
+        ('red', 'Unconstrained'), ('red', 'Constrained'), ('yellow', 'Constrained'),
+        ('blue', 'DC'), ('red', 'DES'), ('yellow', 'RC4'), ('green', 'AES'),
+        ('red', 'RC4'), ('red', 'DES (forced)')
+    ]
+}
+
+
+@lru_cache(maxsize=1024)
+def badge(color: str, label: str) -> str:
+    """Return badge HTML, rendering each (color, label) pair only once"""
+    html = BADGE_HTML.get((color, label))
+    if html is None:
+        html = f'<span class="badge badge-{color}">{label}</span>'
+    return html
+
+
+# Status badges used by the policy, domain controller, trust and group tables
+BADGE_GOOD = badge('green', 'Good')
+BADGE_WEAK = badge('yellow', 'Weak')
+BADGE_CRIT = badge('red', 'Critical')
+BADGE_CRITICAL = badge('red', 'CRITICAL')
+BADGE_REVIEW = badge('yellow', 'Review')
+BADGE_NOTSET = badge('gray', 'Not Set')
+BADGE_NOTSET_RED = badge('red', 'Not Set')
+BADGE_ENABLED_GREEN = badge('green', 'Enabled')
+BADGE_DISABLED_RED = badge('red', 'Disabled')
+BADGE_DISABLED_GREEN = badge('green', 'Disabled')
+BADGE_DISABLED_YELLOW = badge('yellow', 'Disabled')
+BADGE_YES_GREEN = badge('green', 'Yes')
+BADGE_NO_YELLOW = badge('yellow', 'No')
+BADGE_GC = badge('blue', 'GC')
+BADGE_RO = badge('yellow', 'RO')
+BADGE_INBOUND = badge('blue', 'Inbound')
+BADGE_OUTBOUND = badge('green', 'Outbound')
+BADGE_BIDIR = badge('gray', 'Bidirectional')
+BADGE_SCOPE_DOMAIN = badge('blue', 'Domain')
+BADGE_SCOPE_GLOBAL = badge('green', 'Global')
+BADGE_SCOPE_UNIVERSAL = badge('gray', 'Universal')
+
+# Status badges used by the LDAP/SMB, certificate, fine-grained policy, account,
+# group, computer and GPO tables
+BADGE_REQUIRED_GREEN = badge('green', 'Required')
+BADGE_NOT_REQUIRED_RED = badge('red', 'Not Required')
+BADGE_UNKNOWN = badge('gray', 'Unknown')
+BADGE_NO_RED = badge('red', 'No')
+BADGE_EXPIRED = badge('red', 'Expired')
+BADGE_VALID = badge('green', 'Valid')
+BADGE_AUTO_ENROLL = badge('yellow', 'Auto-Enroll')
+BADGE_MANUAL = badge('gray', 'Manual')
+BADGE_HIGH = badge('red', 'High')
+BADGE_MEDIUM = badge('yellow', 'Medium')
+
+# Status badges used by the SMBv1, remote access, event log and computer security tables
+BADGE_ENABLED_RED = badge('red', 'Enabled')
+BADGE_ENABLED_YELLOW = badge('yellow', 'Enabled')
+BADGE_OFFLINE = badge('gray', 'Offline')
+BADGE_INSTALLED = badge('green', 'Installed')
+BADGE_NOT_FOUND = badge('red', 'Not Found')
+BADGE_NO_REALTIME = badge('yellow', 'No Real-time')
+BADGE_NOT_ENABLED_YELLOW = badge('yellow', 'Not Enabled')
+BADGE_RUNNING = badge('green', 'Running')
+BADGE_STOPPED = badge('yellow', 'Stopped')
+
+
+def required_badge(value: Any) -> str:
+    """Required / Not Required / Unknown badge for a True/False/None signing setting"""
+    if value:
+        return BADGE_REQUIRED_GREEN
+    return BADGE_NOT_REQUIRED_RED if value is False else BADGE_UNKNOWN
+
+
+def online_badge(status: Dict[str, Any], key: str, good: str, bad: str) -> str:
+    """good if status[key] is set, else bad for an online computer or Offline"""
+    if status.get(key):
+        return good
+    return bad if status.get('Online') else BADGE_OFFLINE
+
+
+# Collapsible section markup shared by every report section (see section())
+SECTION_OPEN = """
         <div class="section">
             <div class="section-header">
-                <h2><span class="section-icon">▸</span> Recommendations</h2>
+                <h2><span class="section-icon">▸</span> """
+SECTION_MID = """</h2>
                 <span class="section-toggle">▼</span>
             </div>
-            <div class="section-content">
-                <div class="recommendations">
-                    <h3>Remediation Actions</h3>
-                    {recommendations}
-                </div>
+            <div class="section-content">"""
+SECTION_CLOSE = """
             </div>
         </div>
-        
-        <div class="footer">
-            <p>This report was generated by RedSPN - Active Directory Security Audit Tool</p>
-        </div>
-    </div>
-    
-    <script>
-        // Collapsible sections
-        document.querySelectorAll('.section-header').forEach(header => {{
-            header.addEventListener('click', function() {{
-                const section = this.parentElement;
-                section.classList.toggle('collapsed');
-                
-                // Reinitialize graph if graph section is expanded
-                if (section.id === 'graph-section' && !section.classList.contains('collapsed')) {{
-                    setTimeout(initGraph, 100);
-                }}
-            }});
-        }});
-        
-        // BloodHound-style graph visualization
-        function initGraph() {{
-            if (typeof graphNodes === 'undefined' || typeof graphEdges === 'undefined') {{
-                return;
-            }}
-            
-            const container = document.getElementById('graph-container');
-            if (!container) return;
-            
-            const data = {{
-                nodes: new vis.DataSet(graphNodes),
-                edges: new vis.DataSet(graphEdges)
-            }};
-            
-            const options = {{
-                nodes: {{
-                    shape: 'dot',
-                    size: 16,
-                    font: {{
-                        size: 12,
-                        face: 'Segoe UI'
-                    }},
-                    borderWidth: 2,
-                    shadow: true
-                }},
-                edges: {{
-                    width: 2,
-                    color: {{ color: '#848484' }},
-                    smooth: {{
-                        type: 'continuous',
-                        roundness: 0.5
-                    }},
-                    arrows: {{
-                        to: {{ enabled: true, scaleFactor: 0.8 }}
-                    }},
-                    font: {{
-                        size: 10,
-                        align: 'middle'
-                    }}
-                }},
-                physics: {{
-                    enabled: true,
-                    stabilization: {{
-                        iterations: 200
-                    }},
-                    barnesHut: {{
-                        gravitationalConstant: -2000,
-                        centralGravity: 0.1,
-                        springLength: 200,
-                        springConstant: 0.04,
-                        damping: 0.09
-                    }}
-                }},
-                interaction: {{
-                    hover: true,
-                    tooltipDelay: 200,
-                    zoomView: true,
-                    dragView: true
-                }}
-            }};
-            
-            const network = new vis.Network(container, data, options);
-            
-            // Filter controls
-            const filterButtons = document.querySelectorAll('.graph-filter-btn');
-            filterButtons.forEach(btn => {{
-                btn.addEventListener('click', function() {{
-                    const filterType = this.dataset.filter;
-                    filterButtons.forEach(b => b.classList.remove('active'));
-                    this.classList.add('active');
-                    
-                    let visibleNodes, visibleEdges;
-                    
-                    if (filterType === 'attack-paths') {{
-                        // Show nodes involved in attack paths
-                        const pathNodeIds = new Set();
-                        if (typeof attackPaths !== 'undefined') {{
-                            attackPaths.forEach(path => {{
-                                path.path.forEach(nodeId => pathNodeIds.add(nodeId));
-                            }});
-                        }}
-                        visibleNodes = graphNodes.filter(n => pathNodeIds.has(n.id)).map(n => n.id);
-                        visibleEdges = graphEdges.filter(edge => {{
-                            return visibleNodes.includes(edge.from) && visibleNodes.includes(edge.to);
-                        }});
-                        // Highlight attack path edges
-                        visibleEdges.forEach(edge => {{
-                            if (edge.attackPath) {{
-                                edge.width = 4;
-                                edge.color = '#dc3545';
-                            }}
-                        }});
-                    }} else {{
-                        visibleNodes = graphNodes.filter(node => {{
-                            if (filterType === 'all') return true;
-                            if (filterType === 'high-risk') {{
-                                return node.risk === 'high' || node.group === 'Domain Admins' || node.group === 'Enterprise Admins';
-                            }}
-                            return node.type === filterType;
-                        }}).map(n => n.id);
-                        
-                        visibleEdges = graphEdges.filter(edge => {{
-                            return visibleNodes.includes(edge.from) && visibleNodes.includes(edge.to);
-                        }});
-                    }}
-                    
-                    data.nodes.update(graphNodes.filter(n => visibleNodes.includes(n.id)));
-                    data.edges.update(visibleEdges);
-                }});
-            }});
-            
-            // Node click handler - show info panel instead of alert
-            network.on('click', function(params) {{
-                const panel = document.getElementById('node-info-panel');
-                const titleEl = document.getElementById('node-info-title');
-                const contentEl = document.getElementById('node-info-content');
-                
-                if (params.nodes.length > 0) {{
-                    const nodeId = params.nodes[0];
-                    const node = graphNodes.find(n => n.id === nodeId);
-                    if (node) {{
-                        titleEl.textContent = node.label;
-                        let html = '';
-                        html += '<div class="info-row"><span class="info-label">Type:</span><span class="info-value">' + node.type + '</span></div>';
-                        if (node.group) {{
-                            html += '<div class="info-row"><span class="info-label">Group:</span><span class="info-value">' + node.group + '</span></div>';
-                        }}
-                        if (node.risk) {{
-                            const riskColor = node.risk === 'high' ? '#dc3545' : node.risk === 'medium' ? '#ffc107' : '#e74c3c';
-                            html += '<div class="info-row"><span class="info-label">Risk:</span><span class="info-value" style="color: ' + riskColor + '; font-weight: 600;">' + node.risk.toUpperCase() + '</span></div>';
-                        }}
-                        if (node.spns !== undefined && node.spns > 0) {{
-                            html += '<div class="info-row"><span class="info-label">SPNs:</span><span class="info-value">' + node.spns + '</span></div>';
-                        }}
-                        if (node.type === 'user' && typeof userData !== 'undefined') {{
-                            // Find user in data to show more details
-                            const user = userData.find(u => 'user_' + u.SamAccountName === nodeId);
-                            if (user) {{
-                                if (user.PasswordLastSet) {{
-                                    html += '<div class="info-row"><span class="info-label">Password Last Set:</span><span class="info-value">' + user.PasswordLastSet + '</span></div>';
-                                }}
-                                if (user.TrustedForDelegation || user.TrustedToAuthForDelegation) {{
-                                    html += '<div class="info-row"><span class="info-label">Delegation:</span><span class="info-value" style="color: #dc3545;">Enabled</span></div>';
-                                }}
-                                if (user.SPNs && user.SPNs.length > 0) {{
-                                    html += '<div class="info-row"><span class="info-label">SPN Count:</span><span class="info-value">' + user.SPNs.length + '</span></div>';
-                                }}
-                            }}
-                        }}
-                        contentEl.innerHTML = html;
-                        panel.classList.add('visible');
-                    }}
-                }} else {{
-                    // Click on empty space - hide panel
-                    panel.classList.remove('visible');
-                }}
-            }});
-            
-            // Hide panel when clicking outside
-            network.on('oncontext', function(params) {{
-                document.getElementById('node-info-panel').classList.remove('visible');
-            }});
-        }}
-        
-        // Initialize graph when page loads
-        if (document.readyState === 'loading') {{
-            document.addEventListener('DOMContentLoaded', initGraph);
-        }} else {{
-            initGraph();
-        }}
-    </script>
-</body>
-</html>
-"""
+        """
+
+
+def section(title: str, body: str) -> str:
+    """Wrap body HTML in a collapsible report section titled title"""
+    return f'{SECTION_OPEN}{title}{SECTION_MID}{body}{SECTION_CLOSE}'
+
+
+class RowFields(dict):
+    """Row data for str.format_map().
+
+    Keyword arguments are trusted HTML (badges) and are used as-is; any other
+    field is read from the record and HTML-escaped, rendering as N/A when the
+    record does not have it.
+    """
+    def __init__(self, record: Dict[str, Any], **html: str):
+        super().__init__(html)
+        self.record = record
+    
+    def __missing__(self, key: str) -> str:
+        return esc(self.record.get(key, 'N/A'))
+
+
+# Row templates for the per-record tables, filled with
+# format_map(RowFields(record, <badge>=...)) so each row is a single format call.
+# Rows carry no indentation whitespace; on large tables it was a sizeable share of the HTML
+DC_ROW_TEMPLATE = (
+    '<tr>'
+    '<td>{Name}</td>'
+    '<td>{HostName}</td>'
+    '<td>{IPv4Address}</td>'
+    '<td>{OperatingSystem}</td>'
+    '<td>{Site}</td>'
+    '<td>{gc_badge} {ro_badge}</td>'
+    '</tr>'
+)
+
+TRUST_ROW_TEMPLATE = (
+    '<tr>'
+    '<td>{Name}</td>'
+    '<td>{Target}</td>'
+    '<td>{direction_badge}</td>'
+    '<td>{TrustType}</td>'
+    '<td>{selective_auth}</td>'
+    '<td>{sid_filtering}</td>'
+    '</tr>'
+)
+
+GROUP_ROW_TEMPLATE = (
+    '<tr>'
+    '<td>{Name}</td>'
+    '<td>{Description}</td>'
+    '<td>{scope_badge}</td>'
+    '<td>{member_badge}</td>'
+    '</tr>'
+)
+
+CA_ROW_TEMPLATE = (
+    '<tr>'
+    '<td>{Name}</td>'
+    '<td>{thumbprint}</td>'
+    '<td>{NotBefore}</td>'
+    '<td>{NotAfter}</td>'
+    '<td>{expired_badge}</td>'
+    '</tr>'
+)
+
+OUTDATED_ROW_TEMPLATE = (
+    '<tr>'
+    '<td>{name}</td>'
+    '<td>{OperatingSystem}</td>'
+    '<td>{OperatingSystemVersion}</td>'
+    '<td><span class="badge badge-red">{Reason}</span></td>'
+    '<td>{enabled_badge}</td>'
+    '</tr>'
+)
+
+EMPTY_GROUP_ROW_TEMPLATE = (
+    '<tr>'
+    '<td>{Name}</td>'
+    '<td>{GroupScope}</td>'
+    '<td>{GroupCategory}</td>'
+    '</tr>'
+)
+
+SERVICE_ISSUE_ROW_TEMPLATE = (
+    '<tr>'
+    '<td>{SamAccountName}</td>'
+    '<td>{DisplayName}</td>'
+    '<td>{issues_list}</td>'
+    '</tr>'
+)
+
+SUSPICIOUS_ROW_TEMPLATE = (
+    '<tr>'
+    '<td>{SamAccountName}</td>'
+    '<td>{DisplayName}</td>'
+    '<td>{enabled_badge}</td>'
+    '<td>{reasons}</td>'
+    '<td>{member_of}</td>'
+    '</tr>'
+)
+
+FAILED_LOGON_ROW_TEMPLATE = (
+    '<tr>'
+    '<td>{TimeCreated}</td>'
+    '<td>{account}</td>'
+    '<td>{IPAddress}</td>'
+    '<td>{WorkstationName}</td>'
+    '<td>{FailureReason}</td>'
+    '</tr>'
+)
+
+SMBV1_ROW_TEMPLATE = (
+    '<tr>'
+    '<td>{ComputerName}</td>'
+    '<td>{client_badge}</td>'
+    '<td>{server_badge}</td>'
+    '</tr>'
+)
+
+GPO_ROW_TEMPLATE = (
+    '<tr>'
+    '<td>{DisplayName}</td>'
+    '<td>{GUID}</td>'
+    '<td>{Created}</td>'
+    '<td>{Modified}</td>'
+    '<td>{enabled_badge}</td>'
+    '</tr>'
+)
+
+GPO_ISSUE_ROW_TEMPLATE = (
+    '<tr>'
+    '<td>{GPO}</td>'
+    '<td>{Issue}</td>'
+    '<td>{severity_badge}</td>'
+    '</tr>'
+)
+
+
+@lru_cache(maxsize=256)
+def ntlm_event_badge(auth_package: Any, logon_type: Any) -> str:
+    """Badge for an NTLM event row; event logs repeat a handful of value pairs"""
+    # Determine if likely NTLM based on auth package
+    is_ntlm = 'NTLM' in (auth_package or '').upper() or logon_type in ('2', '3')
+    return '<span class="badge badge-red">NTLM</span>' if is_ntlm else '<span class="badge badge-gray">Other</span>'
+
+
+# Per-user risk flags; each user's flags are packed into one int (see
+# ADAuditReportGenerator._classify_accounts) so counters and sort keys test bits
+# instead of re-reading every user dict
+USER_SPN = 0x001
+USER_DELEGATION = 0x002
+USER_WEAK_ENC_TYPE = 0x004  # DES or RC4 in EncryptionTypes
+USER_DES_ONLY = 0x008
+USER_DOMAIN_ADMIN = 0x010
+USER_PROTECTED = 0x020
+USER_INACTIVE = 0x040
+USER_OLD_PASSWORD = 0x080
+USER_ENTERPRISE_ADMIN = 0x100
+USER_UNCONSTRAINED = 0x200
+USER_DES = 0x400
+USER_RC4 = 0x800
+USER_AES = 0x1000  # both AES128 and AES256
+USER_WEAK_ENCRYPTION = USER_WEAK_ENC_TYPE | USER_DES_ONLY
+
+# Account fields that hold lists; null values are replaced with [] on load
+LIST_FIELDS = ('MemberOf', 'SPNs', 'EncryptionTypes', 'ConstrainedDelegation')
+
+
+def normalize_list_fields(entity: Dict[str, Any]) -> None:
+    """Replace null LIST_FIELDS values with [] on an account dict, in place.
+
+    ADAuditReportGenerator applies this to the caller's data, so anything
+    written from the same dict afterwards (--json-export) has the normalized
+    lists rather than the raw collector output.
+    """
+    for key in LIST_FIELDS:
+        if entity.get(key, ()) is None:
+            entity[key] = []
+    # The collector's Get-EncryptionTypes returns a bare string for a single type
+    enc_types = entity.get('EncryptionTypes')
+    if isinstance(enc_types, str):
+        entity['EncryptionTypes'] = [enc_types]
+
+
+# EncryptionTypes packed into bits so per-row checks are integer tests
+ENC_DES = 0x1
+ENC_RC4 = 0x2
+ENC_AES128 = 0x4
+ENC_AES256 = 0x8
+ENC_WEAK = ENC_DES | ENC_RC4
+ENC_AES = ENC_AES128 | ENC_AES256
+ENC_TYPE_BITS = {'DES': ENC_DES, 'RC4': ENC_RC4, 'AES128': ENC_AES128, 'AES256': ENC_AES256}
+
+
+def encryption_bits(enc_types: Iterable[str]) -> int:
+    """Return the ENC_* bits for a list of EncryptionTypes names"""
+    bits = 0
+    for enc in enc_types:
+        bits |= ENC_TYPE_BITS.get(enc, 0)
+    return bits
+
+
+# Constant lookup sets shared by the per-user checks
+WEAK_ENC_TYPES = frozenset(['DES', 'RC4'])
+ADMIN_GROUPS = frozenset(['Domain Admins', 'Enterprise Admins'])
+GRAPH_GROUPS = frozenset(['Domain Admins', 'Enterprise Admins', 'Schema Admins', 'Account Operators'])
+# Built-in accounts skipped by attack-path checks, compared against lowercased SamAccountName
+EXCLUDED_ACCOUNTS = frozenset(['administrator', 'krbtgt', 'guest'])
+
+# Most user nodes drawn in the relationship graph; the riskiest users are kept
+GRAPH_USER_NODE_CAP = 500
+
+# Most rows rendered by the per-record finding tables; the section title keeps the full count
+TABLE_ROW_CAP = 200
+
+
+# (nodes, edges, attack_paths, high_risk_user_count) from _build_graph()
+GraphParts = Tuple[List[Dict[str, Any]], List[Dict[str, Any]], List[Dict[str, Any]], int]
+
+
+def section_data(key: str) -> Callable[[Callable[..., str]], Callable[..., str]]:
+    """Decorator for section builders that render a single top-level audit key.
+
+    The builder receives self.data[key] as its argument; when the key is
+    missing or empty the section is skipped and "" is returned. The result is
+    cached per generator, so rendering a section twice formats it once.
+    """
+    def decorator(build: Callable[..., str]) -> Callable[..., str]:
+        name = build.__name__
+        
+        @wraps(build)
+        def wrapper(self: 'ADAuditReportGenerator') -> str:
+            html = self._section_cache.get(name)
+            if html is None:
+                value = self.data.get(key)
+                html = build(self, value) if value else ""
+                self._section_cache[name] = html
+            return html
+        return wrapper
+    return decorator
 
 
 class ADAuditReportGenerator:
-    def __init__(self, json_data: Dict[str, Any]):
+    def __init__(self, json_data: Dict[str, Any], inline_assets: bool = False):
         self.data = json_data
-        self.risk_scores = {}
-        self.recommendations = []
+        self.inline_assets = inline_assets
+        self._users: List[Dict[str, Any]] = json_data.get('Users', []) or []
+        self._computers: List[Dict[str, Any]] = json_data.get('Computers', []) or []
+        self._service_accounts: List[Dict[str, Any]] = json_data.get('ServiceAccounts', []) or []
+        self._ntlm_events: List[Dict[str, Any]] = json_data.get('NTLMEvents', []) or []
+        self._stats: Dict[str, Any] = json_data.get('Statistics', {}) or {}
+        self.risk_scores: Dict[str, int] = {}
+        self.weak_encryption_count = 0
+        self.recommendations: List[str] = []
+        # Rendered sections and graph, built on first use; the audit data is not
+        # modified after __init__, so repeated renders (e.g. full + summary) reuse them
+        self._section_cache: Dict[str, str] = {}
+        self._graph: Optional[GraphParts] = None
+        self._classify_accounts()
     
-    def _get_member_of(self, user: Dict[str, Any]) -> List[str]:
-        """Safely get MemberOf list, handling None values"""
+    @staticmethod
+    def _get_member_of(user: Dict[str, Any]) -> List[str]:
+        """Safely get MemberOf list, handling None values (also used by export_csv)"""
         member_of = user.get('MemberOf')
         if member_of is None:
             return []
         if isinstance(member_of, list):
             return member_of
         return []
+    
+    def _get_member_set(self, user: Dict[str, Any]) -> FrozenSet[str]:
+        """MemberOf as a set for membership tests, cached per SamAccountName"""
+        member_set = self._member_sets.get(user.get('SamAccountName') or '')
+        if member_set is None:
+            member_set = frozenset(self._get_member_of(user))
+        return member_set
+    
+    def _classify_accounts(self) -> None:
+        """Scan Users and Computers once, recording risk flags and risk buckets.
+
+        The same pass normalizes list fields (see normalize_list_fields), so
+        table code can join and iterate them without None checks.
+        """
+        self._user_flags = array('H')
+        self._spn_users: List[Dict[str, Any]] = []
+        self._deleg_users: List[Dict[str, Any]] = []
+        self._weak_enc_users: List[Dict[str, Any]] = []
+        self._privileged_users: List[Dict[str, Any]] = []
+        self._inactive: List[Dict[str, Any]] = []
+        self._old_pwd: List[Dict[str, Any]] = []
+        self._deleg_computers: List[Dict[str, Any]] = []
+        self._member_sets: Dict[str, FrozenSet[str]] = {}
+        
+        append_flags = self._user_flags.append
+        for u in self._users:
+            normalize_list_fields(u)
+            f = 0
+            member_of = frozenset(self._get_member_of(u))
+            sam = u.get('SamAccountName')
+            if sam:
+                self._member_sets[sam] = member_of
+            if u.get('SPNs'):
+                f |= USER_SPN
+                self._spn_users.append(u)
+            if u.get('TrustedForDelegation') or u.get('TrustedToAuthForDelegation'):
+                f |= USER_DELEGATION
+                self._deleg_users.append(u)
+            if u.get('TrustedForDelegation'):
+                f |= USER_UNCONSTRAINED
+            enc_bits = encryption_bits(u.get('EncryptionTypes', ()))
+            if enc_bits & ENC_WEAK:
+                f |= USER_WEAK_ENC_TYPE
+            if enc_bits & ENC_DES:
+                f |= USER_DES
+            if enc_bits & ENC_RC4:
+                f |= USER_RC4
+            if enc_bits & ENC_AES == ENC_AES:
+                f |= USER_AES
+            if u.get('UseDESKeyOnly', False):
+                f |= USER_DES_ONLY
+            if f & USER_WEAK_ENCRYPTION:
+                self._weak_enc_users.append(u)
+            if 'Domain Admins' in member_of:
+                f |= USER_DOMAIN_ADMIN
+            if 'Enterprise Admins' in member_of:
+                f |= USER_ENTERPRISE_ADMIN
+            if f & (USER_DOMAIN_ADMIN | USER_ENTERPRISE_ADMIN):
+                self._privileged_users.append(u)
+            if 'Protected Users' in member_of:
+                f |= USER_PROTECTED
+            days = u.get('DaysSinceLastLogon')
+            if days and days > 90:
+                f |= USER_INACTIVE
+                self._inactive.append(u)
+            days = u.get('DaysSincePasswordChange')
+            if days and days > 365:
+                f |= USER_OLD_PASSWORD
+                self._old_pwd.append(u)
+            append_flags(f)
+        
+        for c in self._computers:
+            normalize_list_fields(c)
+            if ((c.get('TrustedForDelegation') or c.get('TrustedToAuthForDelegation') or c.get('ConstrainedDelegation'))
+                    and not c.get('IsDomainController', False)):
+                self._deleg_computers.append(c)
+        
+        for svc in self._service_accounts:
+            normalize_list_fields(svc)
+    
+    def _count_users(self, any_of: int, none_of: int = 0) -> int:
+        """Count users having any flag in any_of and none in none_of"""
+        return sum(1 for f in self._user_flags if f & any_of and not f & none_of)
         
     def calculate_risk_scores(self) -> Dict[str, int]:
         """Calculate risk scores for different categories"""
@@ -1041,41 +644,34 @@ class ADAuditReportGenerator:
             'inactive': 0
         }
         
+        spn_users = len(self._spn_users)
+        delegation_users = len(self._deleg_users)
+        weak_encryption_users = len(self._weak_enc_users)
+        unprotected_admins = self._count_users(USER_DOMAIN_ADMIN, USER_PROTECTED)
+        inactive_users = len(self._inactive)
+        old_passwords = len(self._old_pwd)
+        
+        delegation_computers = len(self._deleg_computers)
+        
+        self.weak_encryption_count = weak_encryption_users
+        
         # Kerberoasting risk (SPNs on user accounts)
-        users_with_spns = [u for u in self.data.get('Users', []) if u.get('SPNs') and len(u.get('SPNs', [])) > 0]
-        scores['kerberoasting'] = len(users_with_spns) * 10
+        scores['kerberoasting'] = spn_users * 10
         
         # Delegation risk
-        users_with_delegation = [u for u in self.data.get('Users', []) 
-                                if u.get('TrustedForDelegation') or u.get('TrustedToAuthForDelegation')]
-        computers_with_delegation = [c for c in self.data.get('Computers', [])
-                                    if (c.get('TrustedForDelegation') or c.get('TrustedToAuthForDelegation') or 
-                                        (c.get('ConstrainedDelegation') and len(c.get('ConstrainedDelegation', [])) > 0))
-                                    and not c.get('IsDomainController', False)]
-        scores['delegation'] = (len(users_with_delegation) * 15) + (len(computers_with_delegation) * 20)
+        scores['delegation'] = (delegation_users * 15) + (delegation_computers * 20)
         
         # Encryption risk (DES, RC4, reversible)
-        weak_encryption_users = [u for u in self.data.get('Users', [])
-                               if any(enc in ['DES', 'RC4'] for enc in u.get('EncryptionTypes', []))
-                               or u.get('UseDESKeyOnly', False)]
-        scores['encryption'] = len(weak_encryption_users) * 5
+        scores['encryption'] = weak_encryption_users * 5
         
         # NTLM risk
-        scores['ntlm'] = min(self.data.get('Statistics', {}).get('NTLMEventCount', 0) * 2, 100)
+        scores['ntlm'] = min(self._stats.get('NTLMEventCount', 0) * 2, 100)
         
         # Privileged account risk
-        domain_admins = [u for u in self.data.get('Users', [])
-                        if 'Domain Admins' in self._get_member_of(u)]
-        unprotected_admins = [u for u in domain_admins
-                            if 'Protected Users' not in self._get_member_of(u)]
-        scores['privileged'] = len(unprotected_admins) * 25
+        scores['privileged'] = unprotected_admins * 25
         
         # Inactive accounts
-        inactive_users = [u for u in self.data.get('Users', [])
-                         if u.get('DaysSinceLastLogon') and u.get('DaysSinceLastLogon') > 90]
-        old_passwords = [u for u in self.data.get('Users', [])
-                        if u.get('DaysSincePasswordChange') and u.get('DaysSincePasswordChange') > 365]
-        scores['inactive'] = (len(inactive_users) * 2) + (len(old_passwords) * 3)
+        scores['inactive'] = (inactive_users * 2) + (old_passwords * 3)
         
         self.risk_scores = scores
         return scores
@@ -1093,73 +689,30 @@ class ADAuditReportGenerator:
         else:
             return (int(normalized_score), 'risk-high', 'High Risk')
     
-    def generate_user_table(self) -> str:
-        """Generate HTML table for user accounts with risks"""
-        users = self.data.get('Users', [])
-        
-        # Sort by risk (users with SPNs, delegation, weak encryption first)
-        def risk_sort_key(u):
-            risk = 0
-            if u.get('SPNs') and len(u.get('SPNs', [])) > 0:
-                risk += 1000
-            if u.get('TrustedForDelegation') or u.get('TrustedToAuthForDelegation'):
-                risk += 500
-            if any(enc in ['DES', 'RC4'] for enc in u.get('EncryptionTypes', [])):
-                risk += 200
-            if 'Domain Admins' in self._get_member_of(u):
-                risk += 300
-            return -risk
+    def _user_risk_score(self, i: int) -> int:
+        """Ranking weight for self._users[i] (SPNs, delegation, DA, weak encryption)"""
+        f = self._user_flags[i]
+        risk = 0
+        if f & USER_SPN:
+            risk += 1000
+        if f & USER_DELEGATION:
+            risk += 500
+        if f & USER_WEAK_ENC_TYPE:
+            risk += 200
+        if f & USER_DOMAIN_ADMIN:
+            risk += 300
+        return risk
+    
+    def _iter_user_table(self) -> Iterator[str]:
+        """Yield the user accounts table, one row at a time"""
+        users = self._users
         
-        sorted_users = sorted(users, key=risk_sort_key)
+        # Sort by risk (users with SPNs, delegation, weak encryption first).
+        # Only the top 500 rows are shown, so keep a bounded heap instead of sorting everyone
+        top_users = heapq.nsmallest(500, range(len(users)), key=lambda i: -self._user_risk_score(i))
+        flags = self._user_flags
         
-        rows = []
-        for user in sorted_users[:500]:  # Limit to 500 for performance
-            spn_badge = ''
-            if user.get('SPNs') and len(user.get('SPNs', [])) > 0:
-                spn_badge = '<span class="badge badge-red">SPN</span>'
-            
-            delegation_badge = ''
-            if user.get('TrustedForDelegation'):
-                delegation_badge = '<span class="badge badge-red">Unconstrained</span>'
-            elif user.get('TrustedToAuthForDelegation'):
-                delegation_badge = '<span class="badge badge-yellow">Constrained</span>'
-            
-            encryption_badge = ''
-            enc_types = user.get('EncryptionTypes', [])
-            if 'DES' in enc_types or user.get('UseDESKeyOnly'):
-                encryption_badge = '<span class="badge badge-red">DES</span>'
-            elif 'RC4' in enc_types:
-                encryption_badge = '<span class="badge badge-yellow">RC4</span>'
-            elif 'AES256' in enc_types and 'AES128' in enc_types:
-                encryption_badge = '<span class="badge badge-green">AES</span>'
-            
-            admin_badge = ''
-            member_of = self._get_member_of(user)
-            if 'Domain Admins' in member_of:
-                admin_badge = '<span class="badge badge-red">DA</span>'
-            if 'Enterprise Admins' in member_of:
-                admin_badge += '<span class="badge badge-red">EA</span>'
-            if 'Protected Users' in member_of:
-                admin_badge += '<span class="badge badge-green">Protected</span>'
-            
-            pwd_age = user.get('DaysSincePasswordChange', 'N/A')
-            if isinstance(pwd_age, (int, float)) and pwd_age > 365:
-                pwd_age = f'<span style="color: red; font-weight: bold;">{int(pwd_age)}</span>'
-            
-            rows.append(f"""
-                <tr>
-                    <td>{user.get('SamAccountName', 'N/A')}</td>
-                    <td>{user.get('DisplayName', 'N/A')}</td>
-                    <td>{spn_badge} {delegation_badge} {encryption_badge} {admin_badge}</td>
-                    <td>{', '.join(user.get('SPNs', []))[:50] or 'None'}</td>
-                    <td>{user.get('PasswordLastSet', 'Never')}</td>
-                    <td>{pwd_age}</td>
-                    <td>{'Yes' if user.get('PasswordNeverExpires') else 'No'}</td>
-                    <td>{', '.join(self._get_member_of(user)) or 'None'}</td>
-                </tr>
-            """)
-        
-        return f"""
+        yield f"""
         <div class="section">
             <div class="section-header">
                 <h2><span class="section-icon">▸</span> User Accounts ({len(users)} total)</h2>
@@ -1180,47 +733,73 @@ class ADAuditReportGenerator:
                         </tr>
                     </thead>
                     <tbody>
-                        {''.join(rows)}
+                        """
+        
+        # Badges come from the flags computed during classification
+        for i in top_users:
+            user = users[i]
+            get = user.get
+            f = flags[i]
+            spn_badge = ''
+            if f & USER_SPN:
+                spn_badge = BADGE_HTML[('red', 'SPN')]
+            
+            delegation_badge = ''
+            if f & USER_UNCONSTRAINED:
+                delegation_badge = BADGE_HTML[('red', 'Unconstrained')]
+            elif f & USER_DELEGATION:
+                delegation_badge = BADGE_HTML[('yellow', 'Constrained')]
+            
+            encryption_badge = ''
+            if f & (USER_DES | USER_DES_ONLY):
+                encryption_badge = BADGE_HTML[('red', 'DES')]
+            elif f & USER_RC4:
+                encryption_badge = BADGE_HTML[('yellow', 'RC4')]
+            elif f & USER_AES:
+                encryption_badge = BADGE_HTML[('green', 'AES')]
+            
+            admin_parts = []
+            if f & USER_DOMAIN_ADMIN:
+                admin_parts.append(BADGE_HTML[('red', 'DA')])
+            if f & USER_ENTERPRISE_ADMIN:
+                admin_parts.append(BADGE_HTML[('red', 'EA')])
+            if f & USER_PROTECTED:
+                admin_parts.append(BADGE_HTML[('green', 'Protected')])
+            admin_badge = ''.join(admin_parts)
+            
+            pwd_age = get('DaysSincePasswordChange', 'N/A')
+            if isinstance(pwd_age, (int, float)) and pwd_age > 365:
+                pwd_age = f'<span style="color: red; font-weight: bold;">{int(pwd_age)}</span>'
+            
+            yield (
+                f"<tr>"
+                f"<td>{esc(get('SamAccountName', 'N/A'))}</td>"
+                f"<td>{esc(get('DisplayName', 'N/A'))}</td>"
+                f"<td>{spn_badge} {delegation_badge} {encryption_badge} {admin_badge}</td>"
+                f"<td>{esc(join_truncated(get('SPNs', ()), 50) or 'None')}</td>"
+                f"<td>{esc(get('PasswordLastSet', 'Never'))}</td>"
+                f"<td>{pwd_age}</td>"
+                f"<td>{'Yes' if get('PasswordNeverExpires') else 'No'}</td>"
+                f"<td>{esc(', '.join(self._get_member_of(user)) or 'None')}</td>"
+                f"</tr>"
+            )
+        
+        yield """
                     </tbody>
                 </table>
             </div>
         </div>
         """
     
-    def generate_computer_table(self) -> str:
-        """Generate HTML table for computer accounts"""
-        computers = self.data.get('Computers', [])
-        
-        rows = []
-        for computer in computers[:500]:  # Limit to 500
-            delegation_badge = ''
-            if computer.get('TrustedForDelegation'):
-                delegation_badge = '<span class="badge badge-red">Unconstrained</span>'
-            elif computer.get('TrustedToAuthForDelegation') or (computer.get('ConstrainedDelegation') and len(computer.get('ConstrainedDelegation', [])) > 0):
-                delegation_badge = '<span class="badge badge-yellow">Constrained</span>'
-            
-            if computer.get('IsDomainController'):
-                delegation_badge += '<span class="badge badge-blue">DC</span>'
-            
-            encryption_badge = ''
-            enc_types = computer.get('EncryptionTypes', [])
-            if 'DES' in enc_types:
-                encryption_badge = '<span class="badge badge-red">DES</span>'
-            elif 'RC4' in enc_types:
-                encryption_badge = '<span class="badge badge-yellow">RC4</span>'
-            
-            rows.append(f"""
-                <tr>
-                    <td>{computer.get('SamAccountName', 'N/A')}</td>
-                    <td>{computer.get('OperatingSystem', 'N/A')}</td>
-                    <td>{delegation_badge} {encryption_badge}</td>
-                    <td>{', '.join(computer.get('SPNs', []))[:50] or 'None'}</td>
-                    <td>{', '.join(computer.get('ConstrainedDelegation', []))[:50] or 'None'}</td>
-                    <td>{', '.join(enc_types) or 'None'}</td>
-                </tr>
-            """)
+    def generate_user_table(self) -> str:
+        """Generate HTML table for user accounts with risks"""
+        return ''.join(self._iter_user_table())
+    
+    def _iter_computer_table(self) -> Iterator[str]:
+        """Yield the computer accounts table, one row at a time"""
+        computers = self._computers
         
-        return f"""
+        yield f"""
         <div class="section">
             <div class="section-header">
                 <h2><span class="section-icon">▸</span> Computer Accounts ({len(computers)} total)</h2>
@@ -1239,40 +818,71 @@ class ADAuditReportGenerator:
                         </tr>
                     </thead>
                     <tbody>
-                        {''.join(rows)}
+                        """
+        
+        for computer in computers[:500]:  # Limit to 500
+            get = computer.get
+            delegation_parts = []
+            if get('TrustedForDelegation'):
+                delegation_parts.append(BADGE_HTML[('red', 'Unconstrained')])
+            elif get('TrustedToAuthForDelegation') or get('ConstrainedDelegation'):
+                delegation_parts.append(BADGE_HTML[('yellow', 'Constrained')])
+            
+            if get('IsDomainController'):
+                delegation_parts.append(BADGE_HTML[('blue', 'DC')])
+            delegation_badge = ''.join(delegation_parts)
+            
+            encryption_badge = ''
+            enc_types = get('EncryptionTypes', ())
+            enc_bits = encryption_bits(enc_types)
+            if enc_bits & ENC_DES:
+                encryption_badge = BADGE_HTML[('red', 'DES')]
+            elif enc_bits & ENC_RC4:
+                encryption_badge = BADGE_HTML[('yellow', 'RC4')]
+            
+            yield (
+                f"<tr>"
+                f"<td>{esc(get('SamAccountName', 'N/A'))}</td>"
+                f"<td>{esc(get('OperatingSystem', 'N/A'))}</td>"
+                f"<td>{delegation_badge} {encryption_badge}</td>"
+                f"<td>{esc(join_truncated(get('SPNs', ()), 50) or 'None')}</td>"
+                f"<td>{esc(join_truncated(get('ConstrainedDelegation', ()), 50) or 'None')}</td>"
+                f"<td>{esc(', '.join(enc_types) or 'None')}</td>"
+                f"</tr>"
+            )
+        
+        yield """
                     </tbody>
                 </table>
             </div>
         </div>
         """
     
+    def generate_computer_table(self) -> str:
+        """Generate HTML table for computer accounts"""
+        return ''.join(self._iter_computer_table())
+    
     def generate_service_accounts_table(self) -> str:
         """Generate HTML table for service accounts"""
-        service_accounts = self.data.get('ServiceAccounts', [])
+        service_accounts = self._service_accounts
         
         rows = []
         for svc in service_accounts:
             spn_badge = ''
-            if svc.get('SPNs') and len(svc.get('SPNs', [])) > 0:
-                spn_badge = '<span class="badge badge-red">SPN</span>'
+            if svc.get('SPNs'):
+                spn_badge = BADGE_HTML[('red', 'SPN')]
             
             rows.append(f"""
                 <tr>
-                    <td>{svc.get('Type', 'N/A')}</td>
-                    <td>{svc.get('SamAccountName', 'N/A')}</td>
+                    <td>{esc(svc.get('Type', 'N/A'))}</td>
+                    <td>{esc(svc.get('SamAccountName', 'N/A'))}</td>
                     <td>{spn_badge}</td>
-                    <td>{', '.join(svc.get('SPNs', []))[:100] or 'None'}</td>
+                    <td>{esc(join_truncated(svc.get('SPNs', ()), 100) or 'None')}</td>
                     <td>{'Yes' if svc.get('TrustedForDelegation') or svc.get('TrustedToAuthForDelegation') else 'No'}</td>
                 </tr>
             """)
         
-        return f"""
-        <div class="section">
-            <div class="section-header">
-                <h2><span class="section-icon">▸</span> Service Accounts ({len(service_accounts)} total)</h2>
-                <span class="section-toggle">▼</span>
-            </div>
-            <div class="section-content">
+        return section(f"Service Accounts ({len(service_accounts)} total)", f"""
                 <table>
                     <thead>
                         <tr>
@@ -1286,34 +896,24 @@ class ADAuditReportGenerator:
                     <tbody>
                         {''.join(rows)}
                     </tbody>
-                </table>
-            </div>
-        </div>
-        """
+                </table>""")
     
     def generate_kerberoast_table(self) -> str:
         """Generate table of Kerberoast targets"""
-        users = [u for u in self.data.get('Users', []) 
-                if u.get('SPNs') and len(u.get('SPNs', [])) > 0]
+        users = self._spn_users
         
         rows = []
         for user in users:
             rows.append(f"""
                 <tr>
-                    <td>{user.get('SamAccountName', 'N/A')}</td>
-                    <td>{', '.join(user.get('SPNs', []))}</td>
-                    <td>{user.get('PasswordLastSet', 'Never')}</td>
-                    <td>{user.get('DaysSincePasswordChange', 'N/A')}</td>
+                    <td>{esc(user.get('SamAccountName', 'N/A'))}</td>
+                    <td>{esc(', '.join(user.get('SPNs', ())))}</td>
+                    <td>{esc(user.get('PasswordLastSet', 'Never'))}</td>
+                    <td>{esc(user.get('DaysSincePasswordChange', 'N/A'))}</td>
                 </tr>
             """)
         
-        return f"""
-        <div class="section">
-            <div class="section-header">
-                <h2><span class="section-icon">▸</span> Kerberoast Targets ({len(users)} accounts)</h2>
-                <span class="section-toggle">▼</span>
-            </div>
-            <div class="section-content">
+        return section(f"Kerberoast Targets ({len(users)} accounts)", f"""
                 <div class="alert alert-danger">
                     <strong>Security Risk:</strong> These accounts have SPNs and are vulnerable to Kerberoasting attacks.
                 </div>
@@ -1329,19 +929,12 @@ class ADAuditReportGenerator:
                     <tbody>
                         {''.join(rows)}
                     </tbody>
-                </table>
-            </div>
-        </div>
-        """
+                </table>""")
     
     def generate_delegation_table(self) -> str:
         """Generate table of delegation risks"""
-        users = [u for u in self.data.get('Users', [])
-                if u.get('TrustedForDelegation') or u.get('TrustedToAuthForDelegation')]
-        computers = [c for c in self.data.get('Computers', [])
-                    if (c.get('TrustedForDelegation') or c.get('TrustedToAuthForDelegation') or 
-                        (c.get('ConstrainedDelegation') and len(c.get('ConstrainedDelegation', [])) > 0))
-                    and not c.get('IsDomainController', False)]
+        users = self._deleg_users
+        computers = self._deleg_computers
         
         rows = []
         for user in users:
@@ -1349,9 +942,9 @@ class ADAuditReportGenerator:
             rows.append(f"""
                 <tr>
                     <td>User</td>
-                    <td>{user.get('SamAccountName', 'N/A')}</td>
-                    <td><span class="badge badge-red">{delegation_type}</span></td>
-                    <td>{', '.join(user.get('SPNs', []))[:50] or 'None'}</td>
+                    <td>{esc(user.get('SamAccountName', 'N/A'))}</td>
+                    <td>{BADGE_HTML[('red', delegation_type)]}</td>
+                    <td>{esc(join_truncated(user.get('SPNs', ()), 50) or 'None')}</td>
                 </tr>
             """)
         
@@ -1360,19 +953,13 @@ class ADAuditReportGenerator:
             rows.append(f"""
                 <tr>
                     <td>Computer</td>
-                    <td>{computer.get('SamAccountName', 'N/A')}</td>
-                    <td><span class="badge badge-red">{delegation_type}</span></td>
-                    <td>{', '.join(computer.get('ConstrainedDelegation', []))[:50] or 'None'}</td>
+                    <td>{esc(computer.get('SamAccountName', 'N/A'))}</td>
+                    <td>{BADGE_HTML[('red', delegation_type)]}</td>
+                    <td>{esc(join_truncated(computer.get('ConstrainedDelegation', ()), 50) or 'None')}</td>
                 </tr>
             """)
-        
-        return f"""
-        <div class="section">
-            <div class="section-header">
-                <h2><span class="section-icon">▸</span> Delegation Risks ({len(users) + len(computers)} accounts)</h2>
-                <span class="section-toggle">▼</span>
-            </div>
-            <div class="section-content">
+        
+        return section(f"Delegation Risks ({len(users) + len(computers)} accounts)", f"""
                 <div class="alert alert-danger">
                     <strong>Security Risk:</strong> These accounts have delegation enabled, which can be abused for privilege escalation.
                 </div>
@@ -1388,38 +975,27 @@ class ADAuditReportGenerator:
                     <tbody>
                         {''.join(rows)}
                     </tbody>
-                </table>
-            </div>
-        </div>
-        """
+                </table>""")
     
     def generate_encryption_table(self) -> str:
         """Generate table of weak encryption settings"""
-        users = [u for u in self.data.get('Users', [])
-                if any(enc in ['DES', 'RC4'] for enc in u.get('EncryptionTypes', []))
-                or u.get('UseDESKeyOnly', False)]
+        users = self._weak_enc_users
         
         rows = []
         for user in users:
-            weak_types = [enc for enc in user.get('EncryptionTypes', []) if enc in ['DES', 'RC4']]
+            weak_types = [enc for enc in user.get('EncryptionTypes', ()) if enc in WEAK_ENC_TYPES]
             if user.get('UseDESKeyOnly'):
                 weak_types.append('DES (forced)')
             
             rows.append(f"""
                 <tr>
-                    <td>{user.get('SamAccountName', 'N/A')}</td>
-                    <td><span class="badge badge-red">{', '.join(weak_types)}</span></td>
-                    <td>{', '.join(user.get('EncryptionTypes', []))}</td>
+                    <td>{esc(user.get('SamAccountName', 'N/A'))}</td>
+                    <td>{badge('red', ', '.join(weak_types))}</td>
+                    <td>{esc(', '.join(user.get('EncryptionTypes', ())))}</td>
                 </tr>
             """)
         
-        return f"""
-        <div class="section">
-            <div class="section-header">
-                <h2><span class="section-icon">▸</span> Weak Encryption ({len(users)} accounts)</h2>
-                <span class="section-toggle">▼</span>
-            </div>
-            <div class="section-content">
+        return section(f"Weak Encryption ({len(users)} accounts)", f"""
                 <div class="alert alert-warning">
                     <strong>Security Risk:</strong> These accounts support weak encryption types (DES/RC4) that are vulnerable to attacks.
                 </div>
@@ -1434,21 +1010,11 @@ class ADAuditReportGenerator:
                     <tbody>
                         {''.join(rows)}
                     </tbody>
-                </table>
-            </div>
-        </div>
-        """
+                </table>""")
     
     def generate_privileged_accounts_table(self) -> str:
         """Generate table of privileged accounts"""
-        domain_admins = [u for u in self.data.get('Users', [])
-                        if 'Domain Admins' in self._get_member_of(u)]
-        enterprise_admins = [u for u in self.data.get('Users', [])
-                            if 'Enterprise Admins' in self._get_member_of(u)]
-        
-        all_privileged = list(set([u['SamAccountName'] for u in domain_admins + enterprise_admins]))
-        privileged_users = [u for u in self.data.get('Users', [])
-                           if u.get('SamAccountName') in all_privileged]
+        privileged_users = self._privileged_users
         
         rows = []
         for user in privileged_users:
@@ -1457,21 +1023,15 @@ class ADAuditReportGenerator:
             
             rows.append(f"""
                 <tr>
-                    <td>{user.get('SamAccountName', 'N/A')}</td>
-                    <td>{', '.join([g for g in groups if g in ['Domain Admins', 'Enterprise Admins']])}</td>
+                    <td>{esc(user.get('SamAccountName', 'N/A'))}</td>
+                    <td>{esc(', '.join([g for g in groups if g in ADMIN_GROUPS]))}</td>
                     <td>{protected}</td>
-                    <td>{user.get('PasswordLastSet', 'Never')}</td>
-                    <td>{user.get('DaysSincePasswordChange', 'N/A')}</td>
+                    <td>{esc(user.get('PasswordLastSet', 'Never'))}</td>
+                    <td>{esc(user.get('DaysSincePasswordChange', 'N/A'))}</td>
                 </tr>
             """)
         
-        return f"""
-        <div class="section">
-            <div class="section-header">
-                <h2><span class="section-icon">▸</span> Privileged Accounts ({len(privileged_users)} accounts)</h2>
-                <span class="section-toggle">▼</span>
-            </div>
-            <div class="section-content">
+        return section(f"Privileged Accounts ({len(privileged_users)} accounts)", f"""
                 <table>
                     <thead>
                         <tr>
@@ -1485,47 +1045,37 @@ class ADAuditReportGenerator:
                     <tbody>
                         {''.join(rows)}
                     </tbody>
-                </table>
-            </div>
-        </div>
-        """
+                </table>""")
     
     def generate_inactive_accounts_table(self) -> str:
         """Generate table of inactive accounts and old passwords"""
-        inactive = [u for u in self.data.get('Users', [])
-                   if u.get('DaysSinceLastLogon') and u.get('DaysSinceLastLogon') > 90]
-        old_passwords = [u for u in self.data.get('Users', [])
-                        if u.get('DaysSincePasswordChange') and u.get('DaysSincePasswordChange') > 365]
+        inactive = self._inactive
+        old_passwords = self._old_pwd
+        inactive_names = {u.get('SamAccountName') for u in inactive}
         
         rows = []
         for user in inactive:
             rows.append(f"""
                 <tr>
-                    <td>{user.get('SamAccountName', 'N/A')}</td>
+                    <td>{esc(user.get('SamAccountName', 'N/A'))}</td>
                     <td><span class="badge badge-yellow">Inactive</span></td>
                     <td>{user.get('DaysSinceLastLogon', 'N/A')} days</td>
-                    <td>{user.get('LastLogonDate', 'Never')}</td>
+                    <td>{esc(user.get('LastLogonDate', 'Never'))}</td>
                 </tr>
             """)
         
         for user in old_passwords:
-            if user.get('SamAccountName') not in [u.get('SamAccountName') for u in inactive]:
+            if user.get('SamAccountName') not in inactive_names:
                 rows.append(f"""
                     <tr>
-                        <td>{user.get('SamAccountName', 'N/A')}</td>
+                        <td>{esc(user.get('SamAccountName', 'N/A'))}</td>
                         <td><span class="badge badge-yellow">Old Password</span></td>
                         <td>{user.get('DaysSincePasswordChange', 'N/A')} days</td>
-                        <td>{user.get('PasswordLastSet', 'Never')}</td>
+                        <td>{esc(user.get('PasswordLastSet', 'Never'))}</td>
                     </tr>
                 """)
         
-        return f"""
-        <div class="section">
-            <div class="section-header">
-                <h2><span class="section-icon">▸</span> Inactive Accounts & Old Passwords ({len(inactive) + len(old_passwords)} accounts)</h2>
-                <span class="section-toggle">▼</span>
-            </div>
-            <div class="section-content">
+        return section(f"Inactive Accounts & Old Passwords ({len(inactive) + len(old_passwords)} accounts)", f"""
                 <table>
                     <thead>
                         <tr>
@@ -1538,31 +1088,19 @@ class ADAuditReportGenerator:
                     <tbody>
                         {''.join(rows)}
                     </tbody>
-                </table>
-            </div>
-        </div>
-        """
+                </table>""")
     
-    def generate_krbtgt_info(self) -> str:
+    @section_data('KrbtgtInfo')
+    def generate_krbtgt_info(self, krbtgt: Dict[str, Any]) -> str:
         """Generate krbtgt account information"""
-        krbtgt = self.data.get('KrbtgtInfo')
-        if not krbtgt:
-            return ""
-        
         days = krbtgt.get('DaysSincePasswordChange', 0)
         status_badge = '<span class="badge badge-green">OK</span>' if days < 180 else '<span class="badge badge-red">CRITICAL</span>'
         
-        return f"""
-        <div class="section">
-            <div class="section-header">
-                <h2><span class="section-icon">▸</span> krbtgt Account Status</h2>
-                <span class="section-toggle">▼</span>
-            </div>
-            <div class="section-content">
+        return section("krbtgt Account Status", f"""
                 <div class="summary-stats">
                     <div class="stat-item">
                         <div class="label">Password Last Set</div>
-                        <div class="number">{krbtgt.get('PasswordLastSet', 'Never')}</div>
+                        <div class="number">{esc(krbtgt.get('PasswordLastSet', 'Never'))}</div>
                     </div>
                     <div class="stat-item">
                         <div class="label">Days Since Change</div>
@@ -1575,24 +1113,16 @@ class ADAuditReportGenerator:
                 </div>
                 <div class="alert {'alert-warning' if days >= 150 else 'alert-info'}" style="margin-top: 20px;">
                     {'<strong>Action Required:</strong> krbtgt password should be changed every 180 days. Consider rotating it soon.' if days >= 150 else '<strong>Status:</strong> krbtgt password is within acceptable age.'}
-                </div>
-            </div>
-        </div>
-        """
+                </div>""")
     
     def generate_ntlm_info(self) -> str:
         """Generate NTLM usage information"""
-        events = self.data.get('NTLMEvents', [])
+        events = self._ntlm_events
         event_count = len(events)
         
-        if not events or event_count == 0:
-            return f"""
-        <div class="section">
-            <div class="section-header">
-                <h2><span class="section-icon">▸</span> NTLM Usage Analysis</h2>
-                <span class="section-toggle">▼</span>
-            </div>
-            <div class="section-content">
+        # Nothing to tabulate; keep the short explanation instead of empty tables
+        if not event_count:
+            return section("NTLM Usage Analysis", """
                 <div class="summary-stats">
                     <div class="stat-item">
                         <div class="label">Recent NTLM Events</div>
@@ -1608,54 +1138,39 @@ class ADAuditReportGenerator:
                         <li>Event log may be cleared or rotated</li>
                         <li>NTLM authentication is disabled or blocked</li>
                     </ul>
-                </div>
-            </div>
-        </div>
-        """
+                </div>""")
         
         # Group events by account for summary
-        account_counts = {}
-        ip_counts = {}
-        for event in events:
-            account = f"{event.get('AccountDomain', '')}\\{event.get('AccountName', 'N/A')}"
-            account_counts[account] = account_counts.get(account, 0) + 1
-            ip = event.get('IPAddress', 'N/A')
-            if ip and ip != '-':
-                ip_counts[ip] = ip_counts.get(ip, 0) + 1
+        account_counts = Counter(f"{event.get('AccountDomain', '')}\\{event.get('AccountName', 'N/A')}"
+                                 for event in events)
+        ip_counts = Counter(ip for ip in (event.get('IPAddress', 'N/A') for event in events)
+                            if ip and ip != '-')
         
-        # Sort by count
-        top_accounts = sorted(account_counts.items(), key=lambda x: x[1], reverse=True)[:10]
-        top_ips = sorted(ip_counts.items(), key=lambda x: x[1], reverse=True)[:10]
+        # Top 10 by count
+        top_accounts = account_counts.most_common(10)
+        top_ips = ip_counts.most_common(10)
         
         # Generate event table rows
         rows = []
-        for event in events[:100]:  # Limit to 100 for display
+        for event in islice(events, 100):  # Limit to 100 for display
             account = f"{event.get('AccountDomain', '')}\\{event.get('AccountName', 'N/A')}"
             logon_type = event.get('LogonType', 'N/A')
             auth_package = event.get('AuthenticationPackageName', 'N/A')
-            # Determine if likely NTLM based on auth package
-            is_ntlm = 'NTLM' in (auth_package or '').upper() or logon_type in ['2', '3']
-            ntlm_badge = '<span class="badge badge-red">NTLM</span>' if is_ntlm else '<span class="badge badge-gray">Other</span>'
+            ntlm_badge = ntlm_event_badge(auth_package, logon_type)
             
             rows.append(f"""
                 <tr>
-                    <td>{event.get('TimeCreated', 'N/A')}</td>
-                    <td>{account}</td>
-                    <td>{event.get('IPAddress', 'N/A')}</td>
-                    <td>{event.get('WorkstationName', 'N/A')}</td>
-                    <td>{logon_type}</td>
-                    <td>{auth_package}</td>
+                    <td>{esc(event.get('TimeCreated', 'N/A'))}</td>
+                    <td>{esc(account)}</td>
+                    <td>{esc(event.get('IPAddress', 'N/A'))}</td>
+                    <td>{esc(event.get('WorkstationName', 'N/A'))}</td>
+                    <td>{esc(logon_type)}</td>
+                    <td>{esc(auth_package)}</td>
                     <td>{ntlm_badge}</td>
                 </tr>
             """)
         
-        return f"""
-        <div class="section">
-            <div class="section-header">
-                <h2><span class="section-icon">▸</span> NTLM Usage Analysis</h2>
-                <span class="section-toggle">▼</span>
-            </div>
-            <div class="section-content">
+        return section("NTLM Usage Analysis", f"""
                 <div class="summary-stats">
                     <div class="stat-item">
                         <div class="label">Recent NTLM Events</div>
@@ -1687,7 +1202,7 @@ class ADAuditReportGenerator:
                             </tr>
                         </thead>
                         <tbody>
-                            {''.join([f'<tr><td>{acc}</td><td>{count}</td></tr>' for acc, count in top_accounts])}
+                            {count_rows(top_accounts)}
                         </tbody>
                     </table>
                 </div>
@@ -1704,7 +1219,7 @@ class ADAuditReportGenerator:
                             </tr>
                         </thead>
                         <tbody>
-                            {''.join([f'<tr><td>{ip}</td><td>{count}</td></tr>' for ip, count in top_ips])}
+                            {count_rows(top_ips)}
                         </tbody>
                     </table>
                 </div>
@@ -1731,24 +1246,18 @@ class ADAuditReportGenerator:
                             </tbody>
                         </table>
                     </div>
-                </div>
-            </div>
-        </div>
-        """
+                </div>""")
     
-    def generate_password_policy_table(self) -> str:
+    @section_data('PasswordPolicy')
+    def generate_password_policy_table(self, policy: Dict[str, Any]) -> str:
         """Generate password policy information"""
-        policy = self.data.get('PasswordPolicy')
-        if not policy:
-            return ""
+        min_length = policy.get('MinPasswordLength', 0)
+        max_age = policy.get('MaxPasswordAge')
+        lockout = policy.get('LockoutThreshold')
+        complexity = policy.get('ComplexityEnabled')
+        reversible = policy.get('ReversibleEncryptionEnabled')
         
-        return f"""
-        <div class="section">
-            <div class="section-header">
-                <h2><span class="section-icon">▸</span> Password Policy</h2>
-                <span class="section-toggle">▼</span>
-            </div>
-            <div class="section-content">
+        return section("Password Policy", f"""
                 <table>
                     <thead>
                         <tr>
@@ -1761,73 +1270,53 @@ class ADAuditReportGenerator:
                         <tr>
                             <td>Minimum Password Length</td>
                             <td>{policy.get('MinPasswordLength', 'N/A')}</td>
-                            <td>{'<span class="badge badge-green">Good</span>' if policy.get('MinPasswordLength', 0) >= 14 else '<span class="badge badge-yellow">Weak</span>' if policy.get('MinPasswordLength', 0) >= 8 else '<span class="badge badge-red">Critical</span>'}</td>
+                            <td>{BADGE_GOOD if min_length >= 14 else BADGE_WEAK if min_length >= 8 else BADGE_CRIT}</td>
                         </tr>
                         <tr>
                             <td>Password History Count</td>
                             <td>{policy.get('PasswordHistoryCount', 'N/A')}</td>
-                            <td>{'<span class="badge badge-green">Good</span>' if policy.get('PasswordHistoryCount', 0) >= 12 else '<span class="badge badge-yellow">Weak</span>'}</td>
+                            <td>{BADGE_GOOD if policy.get('PasswordHistoryCount', 0) >= 12 else BADGE_WEAK}</td>
                         </tr>
                         <tr>
                             <td>Maximum Password Age (days)</td>
                             <td>{policy.get('MaxPasswordAge', 'N/A')}</td>
-                            <td>{'<span class="badge badge-green">Good</span>' if policy.get('MaxPasswordAge') and 30 <= policy.get('MaxPasswordAge') <= 90 else '<span class="badge badge-yellow">Review</span>' if policy.get('MaxPasswordAge') else '<span class="badge badge-gray">Not Set</span>'}</td>
+                            <td>{BADGE_GOOD if max_age and 30 <= max_age <= 90 else BADGE_REVIEW if max_age else BADGE_NOTSET}</td>
                         </tr>
                         <tr>
                             <td>Minimum Password Age (days)</td>
                             <td>{policy.get('MinPasswordAge', 'N/A')}</td>
-                            <td>{'<span class="badge badge-green">Good</span>' if policy.get('MinPasswordAge', 0) >= 1 else '<span class="badge badge-yellow">Weak</span>'}</td>
+                            <td>{BADGE_GOOD if policy.get('MinPasswordAge', 0) >= 1 else BADGE_WEAK}</td>
                         </tr>
                         <tr>
                             <td>Complexity Enabled</td>
-                            <td>{'Yes' if policy.get('ComplexityEnabled') else 'No'}</td>
-                            <td>{'<span class="badge badge-green">Enabled</span>' if policy.get('ComplexityEnabled') else '<span class="badge badge-red">Disabled</span>'}</td>
+                            <td>{'Yes' if complexity else 'No'}</td>
+                            <td>{BADGE_ENABLED_GREEN if complexity else BADGE_DISABLED_RED}</td>
                         </tr>
                         <tr>
                             <td>Reversible Encryption</td>
-                            <td>{'Yes' if policy.get('ReversibleEncryptionEnabled') else 'No'}</td>
-                            <td>{'<span class="badge badge-red">CRITICAL</span>' if policy.get('ReversibleEncryptionEnabled') else '<span class="badge badge-green">Disabled</span>'}</td>
+                            <td>{'Yes' if reversible else 'No'}</td>
+                            <td>{BADGE_CRITICAL if reversible else BADGE_DISABLED_GREEN}</td>
                         </tr>
                         <tr>
                             <td>Lockout Threshold</td>
                             <td>{policy.get('LockoutThreshold', 'N/A')}</td>
-                            <td>{'<span class="badge badge-green">Good</span>' if policy.get('LockoutThreshold') and 3 <= policy.get('LockoutThreshold') <= 10 else '<span class="badge badge-yellow">Review</span>' if policy.get('LockoutThreshold') else '<span class="badge badge-red">Not Set</span>'}</td>
+                            <td>{BADGE_GOOD if lockout and 3 <= lockout <= 10 else BADGE_REVIEW if lockout else BADGE_NOTSET_RED}</td>
                         </tr>
                     </tbody>
-                </table>
-            </div>
-        </div>
-        """
+                </table>""")
     
-    def generate_domain_controllers_table(self) -> str:
+    @section_data('DomainControllers')
+    def generate_domain_controllers_table(self, dcs: List[Dict[str, Any]]) -> str:
         """Generate domain controllers table"""
-        dcs = self.data.get('DomainControllers', [])
-        if not dcs:
-            return ""
-        
-        rows = []
+        buf = io.StringIO()
+        write = buf.write
         for dc in dcs:
-            gc_badge = '<span class="badge badge-blue">GC</span>' if dc.get('IsGlobalCatalog') else ''
-            ro_badge = '<span class="badge badge-yellow">RO</span>' if dc.get('IsReadOnly') else ''
+            gc_badge = BADGE_GC if dc.get('IsGlobalCatalog') else ''
+            ro_badge = BADGE_RO if dc.get('IsReadOnly') else ''
             
-            rows.append(f"""
-                <tr>
-                    <td>{dc.get('Name', 'N/A')}</td>
-                    <td>{dc.get('HostName', 'N/A')}</td>
-                    <td>{dc.get('IPv4Address', 'N/A')}</td>
-                    <td>{dc.get('OperatingSystem', 'N/A')}</td>
-                    <td>{dc.get('Site', 'N/A')}</td>
-                    <td>{gc_badge} {ro_badge}</td>
-                </tr>
-            """)
+            write(DC_ROW_TEMPLATE.format_map(RowFields(dc, gc_badge=gc_badge, ro_badge=ro_badge)))
         
-        return f"""
-        <div class="section">
-            <div class="section-header">
-                <h2><span class="section-icon">▸</span> Domain Controllers ({len(dcs)} total)</h2>
-                <span class="section-toggle">▼</span>
-            </div>
-            <div class="section-content">
+        return section(f"Domain Controllers ({len(dcs)} total)", f"""
                 <table>
                     <thead>
                         <tr>
@@ -1840,42 +1329,26 @@ class ADAuditReportGenerator:
                         </tr>
                     </thead>
                     <tbody>
-                        {''.join(rows)}
+                        {buf.getvalue()}
                     </tbody>
-                </table>
-            </div>
-        </div>
-        """
+                </table>""")
     
-    def generate_trust_relationships_table(self) -> str:
+    @section_data('TrustRelationships')
+    def generate_trust_relationships_table(self, trusts: List[Dict[str, Any]]) -> str:
         """Generate trust relationships table"""
-        trusts = self.data.get('TrustRelationships', [])
-        if not trusts:
-            return ""
-        
-        rows = []
+        buf = io.StringIO()
+        write = buf.write
         for trust in trusts:
-            direction_badge = '<span class="badge badge-blue">Inbound</span>' if trust.get('Direction') == 'Inbound' else '<span class="badge badge-green">Outbound</span>' if trust.get('Direction') == 'Outbound' else '<span class="badge badge-gray">Bidirectional</span>'
-            selective_auth = '<span class="badge badge-green">Yes</span>' if trust.get('SelectiveAuthentication') else '<span class="badge badge-yellow">No</span>'
+            direction = trust.get('Direction')
+            direction_badge = BADGE_INBOUND if direction == 'Inbound' else BADGE_OUTBOUND if direction == 'Outbound' else BADGE_BIDIR
+            selective_auth = BADGE_YES_GREEN if trust.get('SelectiveAuthentication') else BADGE_NO_YELLOW
             
-            rows.append(f"""
-                <tr>
-                    <td>{trust.get('Name', 'N/A')}</td>
-                    <td>{trust.get('Target', 'N/A')}</td>
-                    <td>{direction_badge}</td>
-                    <td>{trust.get('TrustType', 'N/A')}</td>
-                    <td>{selective_auth}</td>
-                    <td>{'<span class="badge badge-green">Enabled</span>' if trust.get('SIDFilteringForestAware') else '<span class="badge badge-yellow">Disabled</span>'}</td>
-                </tr>
-            """)
+            sid_filtering = BADGE_ENABLED_GREEN if trust.get('SIDFilteringForestAware') else BADGE_DISABLED_YELLOW
+            
+            write(TRUST_ROW_TEMPLATE.format_map(RowFields(
+                trust, direction_badge=direction_badge, selective_auth=selective_auth, sid_filtering=sid_filtering)))
         
-        return f"""
-        <div class="section">
-            <div class="section-header">
-                <h2><span class="section-icon">▸</span> Trust Relationships ({len(trusts)} total)</h2>
-                <span class="section-toggle">▼</span>
-            </div>
-            <div class="section-content">
+        return section(f"Trust Relationships ({len(trusts)} total)", f"""
                 <div class="alert alert-info">
                     <strong>Security Note:</strong> Review trust relationships regularly. Ensure SID filtering is enabled and use selective authentication where possible.
                 </div>
@@ -1891,41 +1364,24 @@ class ADAuditReportGenerator:
                         </tr>
                     </thead>
                     <tbody>
-                        {''.join(rows)}
+                        {buf.getvalue()}
                     </tbody>
-                </table>
-            </div>
-        </div>
-        """
+                </table>""")
     
-    def generate_security_groups_table(self) -> str:
+    @section_data('SecurityGroups')
+    def generate_security_groups_table(self, groups: List[Dict[str, Any]]) -> str:
         """Generate security groups table"""
-        groups = self.data.get('SecurityGroups', [])
-        if not groups:
-            return ""
-        
-        rows = []
+        buf = io.StringIO()
+        write = buf.write
         for group in groups:
-            scope_badge = '<span class="badge badge-blue">Domain</span>' if group.get('GroupScope') == 'Domain' else '<span class="badge badge-green">Global</span>' if group.get('GroupScope') == 'Global' else '<span class="badge badge-gray">Universal</span>'
+            scope = group.get('GroupScope')
+            scope_badge = BADGE_SCOPE_DOMAIN if scope == 'Domain' else BADGE_SCOPE_GLOBAL if scope == 'Global' else BADGE_SCOPE_UNIVERSAL
             member_count = group.get('MemberCount', 0)
-            member_badge = f'<span class="badge {"badge-red" if member_count > 20 else "badge-yellow" if member_count > 10 else "badge-green"}">{member_count} members</span>'
+            member_badge = badge('red' if member_count > 20 else 'yellow' if member_count > 10 else 'green', f'{member_count} members')
             
-            rows.append(f"""
-                <tr>
-                    <td>{group.get('Name', 'N/A')}</td>
-                    <td>{group.get('Description', 'N/A')}</td>
-                    <td>{scope_badge}</td>
-                    <td>{member_badge}</td>
-                </tr>
-            """)
+            write(GROUP_ROW_TEMPLATE.format_map(RowFields(group, scope_badge=scope_badge, member_badge=member_badge)))
         
-        return f"""
-        <div class="section">
-            <div class="section-header">
-                <h2><span class="section-icon">▸</span> Privileged Security Groups ({len(groups)} groups)</h2>
-                <span class="section-toggle">▼</span>
-            </div>
-            <div class="section-content">
+        return section(f"Privileged Security Groups ({len(groups)} groups)", f"""
                 <table>
                     <thead>
                         <tr>
@@ -1936,24 +1392,28 @@ class ADAuditReportGenerator:
                         </tr>
                     </thead>
                     <tbody>
-                        {''.join(rows)}
+                        {buf.getvalue()}
                     </tbody>
-                </table>
-            </div>
-        </div>
-        """
+                </table>""")
     
-    def generate_graph_visualization(self) -> str:
-        """Generate BloodHound-style interactive graph visualization"""
-        nodes = []
-        edges = []
-        node_id_map = {}
+    def _build_graph(self) -> GraphParts:
+        """Build graph nodes and edges and detect attack paths (once per generator).
+
+        Returns (nodes, edges, attack_paths, high_risk_user_count).
+        """
+        if self._graph is not None:
+            return self._graph
+        
+        nodes: List[Dict[str, Any]] = []
+        edges: List[Dict[str, Any]] = []
+        node_ids: Set[str] = set()
+        graph_user_sams: Set[str] = set()
         node_counter = 1
         
         # Add domain node
         domain = self.data.get('Domain', 'DOMAIN')
         domain_id = f"domain_{domain}"
-        node_id_map[domain_id] = domain_id
+        node_ids.add(domain_id)
         nodes.append({
             'id': domain_id,
             'label': domain,
@@ -1965,47 +1425,63 @@ class ADAuditReportGenerator:
         })
         
         # Add users (limit to high-risk users for performance)
+        flags = self._user_flags
+        # High-risk users with their index into self._users and their node id,
+        # formatted once and shared by the node, edge and attack-path passes
         high_risk_users = []
-        for user in self.data.get('Users', []):
-            risk = 'low'
-            if user.get('SPNs') and len(user.get('SPNs', [])) > 0:
-                risk = 'high'
-            elif user.get('TrustedForDelegation') or user.get('TrustedToAuthForDelegation'):
-                risk = 'high'
-            elif 'Domain Admins' in self._get_member_of(user) or 'Enterprise Admins' in self._get_member_of(user):
-                risk = 'high'
-            elif any(enc in ['DES', 'RC4'] for enc in user.get('EncryptionTypes', [])):
-                risk = 'medium'
-            
-            if risk in ['high', 'medium'] or 'Domain Admins' in self._get_member_of(user):
-                user_id = f"user_{user.get('SamAccountName')}"
-                node_id_map[user_id] = user_id
-                color = '#dc3545' if risk == 'high' else '#ffc107' if risk == 'medium' else '#e74c3c'
-                nodes.append({
-                    'id': user_id,
-                    'label': user.get('SamAccountName', 'N/A'),
-                    'type': 'user',
-                    'group': ', '.join([g for g in self._get_member_of(user) if g in ['Domain Admins', 'Enterprise Admins']]) or 'user',
-                    'risk': risk,
-                    'spns': len(user.get('SPNs', [])) if user.get('SPNs') else 0,
-                    'color': {'background': color, 'border': '#000'},
-                    'size': 20 if risk == 'high' else 16
-                })
-                # Connect user to domain
-                edges.append({
-                    'from': domain_id,
-                    'to': user_id,
-                    'label': 'Member',
-                    'color': '#848484'
-                })
+        high_risk_index = []
+        high_risk_ids = []
+        for i, user in enumerate(self._users):
+            f = flags[i]
+            # Domain/Enterprise Admins members are always high risk, so 'low' users never get a node
+            if f & (USER_SPN | USER_DELEGATION | USER_DOMAIN_ADMIN | USER_ENTERPRISE_ADMIN | USER_WEAK_ENC_TYPE):
                 high_risk_users.append(user)
+                high_risk_index.append(i)
+                high_risk_ids.append(f"user_{user.get('SamAccountName')}")
+        
+        # Very large graphs are unreadable and slow vis.js down, so only the
+        # riskiest users get nodes; attack paths below still cover everyone
+        graphed: Iterable[int] = range(len(high_risk_users))
+        if len(high_risk_users) > GRAPH_USER_NODE_CAP:
+            top = heapq.nsmallest(GRAPH_USER_NODE_CAP, graphed,
+                                  key=lambda k: -self._user_risk_score(high_risk_index[k]))
+            graphed = sorted(top)
+        
+        for k in graphed:
+            user = high_risk_users[k]
+            f = flags[high_risk_index[k]]
+            is_admin = f & (USER_DOMAIN_ADMIN | USER_ENTERPRISE_ADMIN)
+            risk = 'high' if f & (USER_SPN | USER_DELEGATION) or is_admin else 'medium'
+            sam = user.get('SamAccountName')
+            user_id = high_risk_ids[k]
+            node_ids.add(user_id)
+            if sam:
+                graph_user_sams.add(sam)
+            color = '#dc3545' if risk == 'high' else '#ffc107'
+            nodes.append({
+                'id': user_id,
+                'label': user.get('SamAccountName', 'N/A'),
+                'type': 'user',
+                'group': (is_admin and ', '.join([g for g in self._get_member_of(user) if g in ADMIN_GROUPS])) or 'user',
+                'risk': risk,
+                'spns': len(user.get('SPNs') or ()),
+                'color': {'background': color, 'border': '#000'},
+                'size': 20 if risk == 'high' else 16
+            })
+            # Connect user to domain
+            edges.append({
+                'from': domain_id,
+                'to': user_id,
+                'label': 'Member',
+                'color': '#848484'
+            })
         
         # Add security groups
         for group in self.data.get('SecurityGroups', []):
             group_name = group.get('Name', '')
-            if group_name in ['Domain Admins', 'Enterprise Admins', 'Schema Admins', 'Account Operators']:
+            if group_name in GRAPH_GROUPS:
                 group_id = f"group_{group_name}"
-                node_id_map[group_id] = group_id
+                node_ids.add(group_id)
                 nodes.append({
                     'id': group_id,
                     'label': group_name,
@@ -2026,26 +1502,26 @@ class ADAuditReportGenerator:
                 # Connect users to groups
                 for member in group.get('Members', []):
                     user_sam = member.get('SamAccountName')
-                    if user_sam:
-                        user_id = f"user_{user_sam}"
-                        if user_id in node_id_map:
-                            edges.append({
-                                'from': group_id,
-                                'to': user_id,
-                                'label': 'MemberOf',
-                                'color': '#dc3545',
-                                'arrows': 'to'
-                            })
+                    if user_sam and user_sam in graph_user_sams:
+                        edges.append({
+                            'from': group_id,
+                            'to': f"user_{user_sam}",
+                            'label': 'MemberOf',
+                            'color': '#dc3545',
+                            'arrows': 'to'
+                        })
         
         # Add computers (limit to those with delegation or DCs)
-        for computer in self.data.get('Computers', []):
+        graph_comp_ids = []
+        for computer in self._computers:
             if computer.get('TrustedForDelegation') or computer.get('TrustedToAuthForDelegation') or computer.get('IsDomainController'):
                 comp_id = f"comp_{computer.get('SamAccountName')}"
-                node_id_map[comp_id] = comp_id
+                node_ids.add(comp_id)
+                graph_comp_ids.append(comp_id)
                 color = '#dc3545' if computer.get('IsDomainController') else '#ffc107'
                 nodes.append({
                     'id': comp_id,
-                    'label': computer.get('SamAccountName', 'N/A').replace('$', ''),
+                    'label': (computer.get('SamAccountName') or 'N/A').rstrip('$'),
                     'type': 'computer',
                     'group': 'DC' if computer.get('IsDomainController') else 'computer',
                     'color': {'background': color, 'border': '#000'},
@@ -2060,149 +1536,125 @@ class ADAuditReportGenerator:
                     'color': '#848484'
                 })
         
-        # Add delegation relationships
-        for user in high_risk_users:
-            if user.get('TrustedForDelegation') or user.get('TrustedToAuthForDelegation'):
-                user_id = f"user_{user.get('SamAccountName')}"
-                if user_id in node_id_map:
-                    # Find computers this user can delegate to
-                    for computer in self.data.get('Computers', []):
-                        comp_id = f"comp_{computer.get('SamAccountName')}"
-                        if comp_id in node_id_map:
-                            edges.append({
-                                'from': user_id,
-                                'to': comp_id,
-                                'label': 'DelegatesTo',
-                                'color': '#dc3545',
-                                'dashes': True,
-                                'arrows': 'to',
-                                'attackPath': True
-                            })
-        
-        # Detect attack paths (excluding normal/expected configurations)
-        attack_paths = []
-        
-        # Exclude list for normal accounts
-        excluded_accounts = ['Administrator', 'krbtgt', 'Guest']
-        
-        # 1. Find paths to Domain Admins via group membership (exclude default Administrator)
+        # Detect attack paths (excluding normal/expected configurations).
+        # Every user check only applies to high-risk users, so one pass over
+        # them covers checks 1-4; each check keeps its own list so the paths
+        # are still reported grouped by type.
+        da_paths = []
+        kerberoast_paths = []
+        delegation_paths = []
+        asrep_paths = []
+        
         domain_admins_group_id = f"group_Domain Admins"
-        if domain_admins_group_id in node_id_map:
-            for user in self.data.get('Users', []):
-                user_sam = user.get('SamAccountName', '')
-                # Skip default Administrator account unless it has other issues
-                if user_sam.lower() == 'administrator':
-                    continue
+        has_da_group = domain_admins_group_id in node_ids
+        
+        for k, user in enumerate(high_risk_users):
+            sam = user.get('SamAccountName')
+            user_id = high_risk_ids[k]
+            f = flags[high_risk_index[k]]
+            
+            if f & USER_DELEGATION:
+                # Add delegation relationships to every graphed computer; these are
+                # the graph's attack-path edges, so they are styled as such here
+                if user_id in node_ids:
+                    edges.extend({
+                        'from': user_id,
+                        'to': comp_id,
+                        'label': 'DelegatesTo',
+                        'color': '#dc3545',
+                        'dashes': True,
+                        'arrows': 'to',
+                        'attackPath': True,
+                        'width': 3
+                    } for comp_id in graph_comp_ids)
                 
-                user_id = f"user_{user_sam}"
-                if user_id in node_id_map:
-                    member_of = self._get_member_of(user)
-                    if 'Domain Admins' in member_of:
-                        # Check if user is in Protected Users (less risky)
-                        is_protected = 'Protected Users' in member_of
-                        severity = 'high' if is_protected else 'critical'
-                        path = {
-                            'type': 'Group Membership',
-                            'severity': severity,
-                            'description': f"User {user_sam} is a member of Domain Admins" + (" (Protected Users)" if is_protected else " (NOT in Protected Users)"),
-                            'path': [user_id, domain_admins_group_id],
-                            'steps': [f"User {user_sam} → Domain Admins (Direct Membership)"]
-                        }
-                        attack_paths.append(path)
-        
-        # 2. Find Kerberoast attack paths (users with SPNs, exclude krbtgt)
-        for user in self.data.get('Users', []):
-            user_sam = user.get('SamAccountName', '')
-            # Skip krbtgt (it's supposed to have SPNs)
-            if user_sam.lower() == 'krbtgt':
-                continue
+                # 3. Delegation attack paths
+                delegation_type = 'Unconstrained' if f & USER_UNCONSTRAINED else 'Constrained'
+                delegation_paths.append({
+                    'type': f'{delegation_type} Delegation',
+                    'severity': 'high',
+                    'description': f"User {sam} has {delegation_type.lower()} delegation enabled",
+                    'path': [user_id],
+                    'steps': [f"User {sam} → Can delegate to services (Privilege Escalation)"]
+                })
             
-            if user.get('SPNs') and len(user.get('SPNs', [])) > 0:
-                user_id = f"user_{user_sam}"
-                if user_id in node_id_map:
-                    # Only flag if user is NOT a service account (heuristic)
-                    is_likely_service = (
-                        user_sam.lower().startswith('svc_') or 
-                        'service' in user_sam.lower() or
-                        user.get('Description', '').lower().find('service') >= 0
-                    )
-                    severity = 'medium' if is_likely_service else 'high'
-                    path = {
-                        'type': 'Kerberoasting',
+            if sam is None:
+                continue
+            sam_lower = sam.lower()
+            
+            # 1. Paths to Domain Admins via group membership (skip default Administrator)
+            if has_da_group and sam_lower != 'administrator':
+                member_of = self._get_member_set(user)
+                if 'Domain Admins' in member_of:
+                    # Check if user is in Protected Users (less risky)
+                    is_protected = 'Protected Users' in member_of
+                    severity = 'high' if is_protected else 'critical'
+                    da_paths.append({
+                        'type': 'Group Membership',
                         'severity': severity,
-                        'description': f"User {user_sam} has SPNs and is vulnerable to Kerberoasting" + (" (likely service account)" if is_likely_service else ""),
-                        'path': [user_id],
-                        'steps': [f"User {user_sam} has SPNs: {', '.join(user.get('SPNs', [])[:3])}"]
-                    }
-                    attack_paths.append(path)
-        
-        # 3. Find delegation attack paths
-        for user in high_risk_users:
-            if user.get('TrustedForDelegation') or user.get('TrustedToAuthForDelegation'):
-                user_id = f"user_{user.get('SamAccountName')}"
-                if user_id in node_id_map:
-                    delegation_type = 'Unconstrained' if user.get('TrustedForDelegation') else 'Constrained'
-                    path = {
-                        'type': f'{delegation_type} Delegation',
-                        'severity': 'high',
-                        'description': f"User {user.get('SamAccountName')} has {delegation_type.lower()} delegation enabled",
-                        'path': [user_id],
-                        'steps': [f"User {user.get('SamAccountName')} → Can delegate to services (Privilege Escalation)"]
-                    }
-                    attack_paths.append(path)
+                        'description': f"User {sam} is a member of Domain Admins" + (" (Protected Users)" if is_protected else " (NOT in Protected Users)"),
+                        'path': [user_id, domain_admins_group_id],
+                        'steps': [f"User {sam} → Domain Admins (Direct Membership)"]
+                    })
+            
+            # 2. Kerberoast attack paths (skip krbtgt, it's supposed to have SPNs)
+            spns = user.get('SPNs')
+            if spns and sam_lower != 'krbtgt':
+                # Only flag if user is NOT a service account (heuristic)
+                is_likely_service = (
+                    sam_lower.startswith('svc_') or 
+                    'service' in sam_lower or
+                    'service' in user.get('Description', '').lower()
+                )
+                severity = 'medium' if is_likely_service else 'high'
+                kerberoast_paths.append({
+                    'type': 'Kerberoasting',
+                    'severity': severity,
+                    'description': f"User {sam} has SPNs and is vulnerable to Kerberoasting" + (" (likely service account)" if is_likely_service else ""),
+                    'path': [user_id],
+                    'steps': [f"User {sam} has SPNs: {', '.join(spns[:3])}"]
+                })
+            
+            # 4. AS-REP roasting paths (exclude normal accounts)
+            if user.get('DoesNotRequirePreAuth') and sam_lower not in EXCLUDED_ACCOUNTS:
+                asrep_paths.append({
+                    'type': 'AS-REP Roasting',
+                    'severity': 'high',
+                    'description': f"User {sam} does not require pre-authentication (AS-REP roasting)",
+                    'path': [user_id],
+                    'steps': [f"User {sam} → Vulnerable to AS-REP roasting"]
+                })
         
-        # 4. Find AS-REP roasting paths (exclude normal accounts)
-        excluded_accounts = ['Administrator', 'krbtgt', 'Guest']
-        for user in self.data.get('Users', []):
-            user_sam = user.get('SamAccountName', '')
-            if user_sam.lower() in [acc.lower() for acc in excluded_accounts]:
-                continue
-                
-            if user.get('DoesNotRequirePreAuth'):
-                user_id = f"user_{user_sam}"
-                if user_id in node_id_map:
-                    path = {
-                        'type': 'AS-REP Roasting',
-                        'severity': 'high',
-                        'description': f"User {user_sam} does not require pre-authentication (AS-REP roasting)",
-                        'path': [user_id],
-                        'steps': [f"User {user_sam} → Vulnerable to AS-REP roasting"]
-                    }
-                    attack_paths.append(path)
+        attack_paths = da_paths + kerberoast_paths + delegation_paths + asrep_paths
         
-        # 5. Find unconstrained delegation on non-DC computers (high risk)
-        for computer in self.data.get('Computers', []):
-            if computer.get('TrustedForDelegation') and not computer.get('IsDomainController'):
+        # 5. Find unconstrained delegation on non-DC computers (high risk);
+        # _deleg_computers already holds just the non-DCs with any delegation
+        for computer in self._deleg_computers:
+            if computer.get('TrustedForDelegation'):
                 comp_id = f"comp_{computer.get('SamAccountName')}"
-                if comp_id in node_id_map:
+                if comp_id in node_ids:
+                    comp_name = (computer.get('SamAccountName') or '').rstrip('$')
                     path = {
                         'type': 'Unconstrained Delegation',
                         'severity': 'critical',
-                        'description': f"Computer {computer.get('SamAccountName', '').replace('$', '')} has unconstrained delegation (non-DC)",
+                        'description': f"Computer {comp_name} has unconstrained delegation (non-DC)",
                         'path': [comp_id],
-                        'steps': [f"Computer {computer.get('SamAccountName', '').replace('$', '')} → Unconstrained delegation allows privilege escalation"]
+                        'steps': [f"Computer {comp_name} → Unconstrained delegation allows privilege escalation"]
                     }
                     attack_paths.append(path)
         
-        # 6. Find paths through nested groups (simplified - direct memberships only for now)
-        # Mark edges that are part of attack paths
-        attack_path_edge_ids = set()
-        for path in attack_paths:
-            for i in range(len(path['path']) - 1):
-                edge_key = f"{path['path'][i]}_{path['path'][i+1]}"
-                attack_path_edge_ids.add(edge_key)
-        
-        # Mark attack path edges
-        for edge in edges:
-            edge_key = f"{edge['from']}_{edge['to']}"
-            if edge_key in attack_path_edge_ids or edge.get('attackPath'):
-                edge['attackPath'] = True
-                edge['width'] = 3
-                edge['color'] = '#dc3545'
+        # 6. Paths through nested groups are not followed yet (direct memberships only)
+        
+        self._graph = (nodes, edges, attack_paths, len(high_risk_users))
+        return self._graph
+    
+    def _iter_graph_visualization(self) -> Iterator[str]:
+        """Yield the graph section; the (large) graph JSON is its own chunk"""
+        nodes, edges, attack_paths, high_risk_count = self._build_graph()
         
         # Prepare user data for node info panel
         user_data_for_js = []
-        for user in self.data.get('Users', []):
+        for user in self._users:
             user_data_for_js.append({
                 'SamAccountName': user.get('SamAccountName'),
                 'PasswordLastSet': user.get('PasswordLastSet'),
@@ -2211,14 +1663,26 @@ class ADAuditReportGenerator:
                 'SPNs': user.get('SPNs', [])
             })
         
-        graph_data_js = f"""
-        const graphNodes = {json.dumps(nodes, indent=8)};
-        const graphEdges = {json.dumps(edges, indent=8)};
-        const attackPaths = {json.dumps(attack_paths, indent=8)};
-        const userData = {json.dumps(user_data_for_js, indent=8)};
-        """
+        # One compact payload keeps json on its C encoder (indent forces the pure-Python one);
+        # records are sent as columns and rebuilt by fromColumns() in the page
+        graph_payload = to_js_parsed({
+            'nodes': to_columns(nodes),
+            'edges': to_columns(edges),
+            'attackPaths': to_columns(attack_paths),
+            'userData': to_columns(user_data_for_js)
+        })
+        graph_notice = ''
+        if high_risk_count > GRAPH_USER_NODE_CAP:
+            graph_notice = f"""
+                <div class="alert alert-info">
+                    Showing the {GRAPH_USER_NODE_CAP} highest-risk of {high_risk_count} high-risk users in the graph. Attack paths below cover all of them.
+                </div>"""
+        
+        severity_counts = Counter([p.get('severity') for p in attack_paths])
+        critical_paths = severity_counts['critical']
+        high_paths = severity_counts['high']
         
-        return f"""
+        yield f"""
         <div class="section">
             <div class="section-header">
                 <h2><span class="section-icon">▸</span> Active Directory Relationship Graph</h2>
@@ -2236,11 +1700,11 @@ class ADAuditReportGenerator:
                 <div style="margin-bottom: 15px;">
                     <strong>Attack Paths Detected: {len(attack_paths)}</strong>
                     <div style="margin-top: 10px; font-size: 12px; color: #6c757d;">
-                        {f'<span style="color: #dc3545;">●</span> Critical: {len([p for p in attack_paths if p.get("severity") == "critical"])} | ' if len([p for p in attack_paths if p.get("severity") == "critical"]) > 0 else ''}
-                        {f'<span style="color: #ffc107;">●</span> High: {len([p for p in attack_paths if p.get("severity") == "high"])}' if len([p for p in attack_paths if p.get("severity") == "high"]) > 0 else ''}
+                        {f'<span style="color: #dc3545;">●</span> Critical: {critical_paths} | ' if critical_paths > 0 else ''}
+                        {f'<span style="color: #ffc107;">●</span> High: {high_paths}' if high_paths > 0 else ''}
                     </div>
                 </div>
-                <div id="graph-container"></div>
+                <div id="graph-container"></div>{graph_notice}
                 <div id="node-info-panel" class="node-info-panel">
                     <button class="close-btn" onclick="document.getElementById('node-info-panel').classList.remove('visible')">×</button>
                     <h3 id="node-info-title">Node Information</h3>
@@ -2280,33 +1744,67 @@ class ADAuditReportGenerator:
                     Click "Attack Paths" to highlight all discovered privilege escalation paths.
                 </p>
                 <script>
-                    {graph_data_js}
+                    
+        const graphData = """
+        yield graph_payload
+        yield """;
+        const fromColumns = blocks => blocks.flatMap(([keys, rows]) =>
+            rows.map(row => Object.fromEntries(keys.map((key, i) => [key, row[i]]))));
+        const graphNodes = fromColumns(graphData.nodes);
+        const graphEdges = fromColumns(graphData.edges);
+        const attackPaths = fromColumns(graphData.attackPaths);
+        const userData = fromColumns(graphData.userData);
+        
                 </script>
             </div>
         </div>
         """
     
+    def generate_graph_visualization(self) -> str:
+        """Generate BloodHound-style interactive graph visualization"""
+        return ''.join(self._iter_graph_visualization())
+    
+    def generate_attack_paths_summary(self, full_href: str = '') -> str:
+        """Attack path counts and list without the graph, for the summary report"""
+        attack_paths = self._build_graph()[2]
+        severity_counts = Counter([p.get('severity') for p in attack_paths])
+        critical_paths = severity_counts['critical']
+        high_paths = severity_counts['high']
+        full_link = ''
+        if full_href:
+            full_link = f"""
+                <p style="margin-top: 15px; font-size: 12px; color: #6c757d;">
+                    The relationship graph and per-account tables are in the <a href="{esc(full_href)}">full report</a>.
+                </p>"""
+        
+        return section(f"Attack Paths ({len(attack_paths)} detected)", f"""
+                <div style="margin-bottom: 15px; font-size: 12px; color: #6c757d;">
+                    <span style="color: #dc3545;">●</span> Critical: {critical_paths} |
+                    <span style="color: #ffc107;">●</span> High: {high_paths}
+                </div>
+                {self._format_attack_paths(attack_paths)}{full_link}""")
+    
     def _format_attack_paths(self, attack_paths: List[Dict[str, Any]]) -> str:
         """Format attack paths for display"""
         if not attack_paths:
             return '<p style="color: #6c757d;">No attack paths detected.</p>'
         
-        html = '<div style="font-size: 12px;">'
+        parts = ['<div style="font-size: 12px;">']
         for i, path in enumerate(attack_paths[:20]):  # Limit to 20 for performance
             severity_color = '#dc3545' if path.get('severity') == 'critical' else '#ffc107'
-            html += f'''
+            parts.append(f'''
             <div style="margin-bottom: 10px; padding: 8px; background: white; border-left: 3px solid {severity_color};">
-                <strong style="color: {severity_color};">{path.get('type', 'Unknown')}</strong>
-                <div style="margin-top: 4px; color: #495057;">{path.get('description', '')}</div>
+                <strong style="color: {severity_color};">{esc(path.get('type', 'Unknown'))}</strong>
+                <div style="margin-top: 4px; color: #495057;">{esc(path.get('description', ''))}</div>
                 <div style="margin-top: 4px; font-size: 11px; color: #6c757d;">
-                    {' → '.join(path.get('steps', []))}
+                    {esc(' → '.join(path.get('steps', ())))}
                 </div>
             </div>
-            '''
+            ''')
         if len(attack_paths) > 20:
-            html += f'<p style="color: #6c757d; margin-top: 10px;">... and {len(attack_paths) - 20} more attack paths</p>'
-        html += '</div>'
-        return html
+            parts.append(f'<p style="color: #6c757d; margin-top: 10px;">... and {len(attack_paths) - 20} more attack paths</p>')
+        parts.append('</div>')
+        return ''.join(parts)
     
     def generate_domain_info_table(self) -> str:
         """Generate domain and forest information"""
@@ -2318,34 +1816,25 @@ class ADAuditReportGenerator:
         
         rows = []
         if domain_info:
-            rows.append(f"<tr><td><strong>Domain Name</strong></td><td>{domain_info.get('Name', 'N/A')}</td></tr>")
-            rows.append(f"<tr><td><strong>NetBIOS Name</strong></td><td>{domain_info.get('NetBIOSName', 'N/A')}</td></tr>")
-            rows.append(f"<tr><td><strong>Domain Mode</strong></td><td>{domain_info.get('DomainMode', 'N/A')}</td></tr>")
-            rows.append(f"<tr><td><strong>Domain SID</strong></td><td>{domain_info.get('DomainSID', 'N/A')}</td></tr>")
-            rows.append(f"<tr><td><strong>Created</strong></td><td>{domain_info.get('Created', 'N/A')}</td></tr>")
+            rows.append(f"<tr><td><strong>Domain Name</strong></td><td>{esc(domain_info.get('Name', 'N/A'))}</td></tr>")
+            rows.append(f"<tr><td><strong>NetBIOS Name</strong></td><td>{esc(domain_info.get('NetBIOSName', 'N/A'))}</td></tr>")
+            rows.append(f"<tr><td><strong>Domain Mode</strong></td><td>{esc(domain_info.get('DomainMode', 'N/A'))}</td></tr>")
+            rows.append(f"<tr><td><strong>Domain SID</strong></td><td>{esc(domain_info.get('DomainSID', 'N/A'))}</td></tr>")
+            rows.append(f"<tr><td><strong>Created</strong></td><td>{esc(domain_info.get('Created', 'N/A'))}</td></tr>")
         
         if forest_info:
-            rows.append(f"<tr><td><strong>Forest Name</strong></td><td>{forest_info.get('Name', 'N/A')}</td></tr>")
-            rows.append(f"<tr><td><strong>Forest Mode</strong></td><td>{forest_info.get('ForestMode', 'N/A')}</td></tr>")
-            rows.append(f"<tr><td><strong>Schema Master</strong></td><td>{forest_info.get('SchemaMaster', 'N/A')}</td></tr>")
-            rows.append(f"<tr><td><strong>Domain Naming Master</strong></td><td>{forest_info.get('DomainNamingMaster', 'N/A')}</td></tr>")
-            rows.append(f"<tr><td><strong>Root Domain</strong></td><td>{forest_info.get('RootDomain', 'N/A')}</td></tr>")
+            rows.append(f"<tr><td><strong>Forest Name</strong></td><td>{esc(forest_info.get('Name', 'N/A'))}</td></tr>")
+            rows.append(f"<tr><td><strong>Forest Mode</strong></td><td>{esc(forest_info.get('ForestMode', 'N/A'))}</td></tr>")
+            rows.append(f"<tr><td><strong>Schema Master</strong></td><td>{esc(forest_info.get('SchemaMaster', 'N/A'))}</td></tr>")
+            rows.append(f"<tr><td><strong>Domain Naming Master</strong></td><td>{esc(forest_info.get('DomainNamingMaster', 'N/A'))}</td></tr>")
+            rows.append(f"<tr><td><strong>Root Domain</strong></td><td>{esc(forest_info.get('RootDomain', 'N/A'))}</td></tr>")
         
-        return f"""
-        <div class="section">
-            <div class="section-header">
-                <h2><span class="section-icon">▸</span> Domain & Forest Information</h2>
-                <span class="section-toggle">▼</span>
-            </div>
-            <div class="section-content">
+        return section("Domain & Forest Information", f"""
                 <table class="data-table">
                     <tbody>
                         {''.join(rows)}
                     </tbody>
-                </table>
-            </div>
-        </div>
-        """
+                </table>""")
     
     def generate_ldap_smb_policy_table(self) -> str:
         """Generate LDAP and SMB signing policy information"""
@@ -2358,24 +1847,18 @@ class ADAuditReportGenerator:
         rows = []
         if ldap_policy:
             ldap_signing = ldap_policy.get('LDAPSigningRequired')
-            ldap_badge = '<span class="badge badge-green">Required</span>' if ldap_signing else '<span class="badge badge-red">Not Required</span>' if ldap_signing is False else '<span class="badge badge-gray">Unknown</span>'
+            ldap_badge = required_badge(ldap_signing)
             rows.append(f"<tr><td><strong>LDAP Signing Required</strong></td><td>{ldap_badge}</td></tr>")
         
         if smb_policy:
             smb_client = smb_policy.get('ClientSigningRequired')
             smb_server = smb_policy.get('ServerSigningRequired')
-            client_badge = '<span class="badge badge-green">Required</span>' if smb_client else '<span class="badge badge-red">Not Required</span>' if smb_client is False else '<span class="badge badge-gray">Unknown</span>'
-            server_badge = '<span class="badge badge-green">Required</span>' if smb_server else '<span class="badge badge-red">Not Required</span>' if smb_server is False else '<span class="badge badge-gray">Unknown</span>'
+            client_badge = required_badge(smb_client)
+            server_badge = required_badge(smb_server)
             rows.append(f"<tr><td><strong>SMB Client Signing</strong></td><td>{client_badge}</td></tr>")
             rows.append(f"<tr><td><strong>SMB Server Signing</strong></td><td>{server_badge}</td></tr>")
         
-        return f"""
-        <div class="section">
-            <div class="section-header">
-                <h2><span class="section-icon">▸</span> LDAP & SMB Signing Policy</h2>
-                <span class="section-toggle">▼</span>
-            </div>
-            <div class="section-content">
+        return section("LDAP & SMB Signing Policy", f"""
                 <table class="data-table">
                     <tbody>
                         {''.join(rows)}
@@ -2383,39 +1866,27 @@ class ADAuditReportGenerator:
                 </table>
                 <div class="alert alert-warning" style="margin-top: 15px;">
                     <strong>Security Note:</strong> LDAP and SMB signing should be required to prevent man-in-the-middle attacks.
-                </div>
-            </div>
-        </div>
-        """
+                </div>""")
     
-    def generate_fine_grained_password_policies_table(self) -> str:
+    @section_data('FineGrainedPasswordPolicies')
+    def generate_fine_grained_password_policies_table(self, policies: List[Dict[str, Any]]) -> str:
         """Generate fine-grained password policies table"""
-        policies = self.data.get('FineGrainedPasswordPolicies', [])
-        
-        if not policies:
-            return ""
-        
-        rows = []
-        for policy in policies:
-            applies_to = ', '.join(policy.get('AppliesTo', [])) if policy.get('AppliesTo') else 'N/A'
-            rows.append(f"""
+        buf = io.StringIO()
+        write = buf.write
+        applies = [esc(', '.join(p['AppliesTo']) if p.get('AppliesTo') else 'N/A') for p in policies]
+        for policy, applies_to in zip(policies, applies):
+            write(f"""
                 <tr>
-                    <td>{policy.get('Name', 'N/A')}</td>
+                    <td>{esc(policy.get('Name', 'N/A'))}</td>
                     <td>{policy.get('MinPasswordLength', 'N/A')}</td>
                     <td>{policy.get('PasswordHistoryCount', 'N/A')}</td>
                     <td>{policy.get('LockoutThreshold', 'N/A')}</td>
-                    <td>{'<span class="badge badge-green">Yes</span>' if policy.get('ComplexityEnabled') else '<span class="badge badge-red">No</span>'}</td>
+                    <td>{BADGE_YES_GREEN if policy.get('ComplexityEnabled') else BADGE_NO_RED}</td>
                     <td>{applies_to}</td>
                 </tr>
             """)
         
-        return f"""
-        <div class="section">
-            <div class="section-header">
-                <h2><span class="section-icon">▸</span> Fine-Grained Password Policies ({len(policies)})</h2>
-                <span class="section-toggle">▼</span>
-            </div>
-            <div class="section-content">
+        return section(f"Fine-Grained Password Policies ({len(policies)})", f"""
                 <div class="table-container">
                     <table class="data-table">
                         <thead>
@@ -2429,41 +1900,26 @@ class ADAuditReportGenerator:
                             </tr>
                         </thead>
                         <tbody>
-                            {''.join(rows)}
+                            {buf.getvalue()}
                         </tbody>
                     </table>
-                </div>
-            </div>
-        </div>
-        """
+                </div>""")
     
-    def generate_certificate_authorities_table(self) -> str:
+    @section_data('CertificateAuthorities')
+    def generate_certificate_authorities_table(self, cas: List[Dict[str, Any]]) -> str:
         """Generate certificate authorities table"""
-        cas = self.data.get('CertificateAuthorities', [])
-        
-        if not cas:
-            return ""
-        
-        rows = []
+        buf = io.StringIO()
+        write = buf.write
         for ca in cas:
-            expired_badge = '<span class="badge badge-red">Expired</span>' if ca.get('IsExpired') else '<span class="badge badge-green">Valid</span>'
-            rows.append(f"""
-                <tr>
-                    <td>{ca.get('Name', 'N/A')}</td>
-                    <td>{ca.get('Thumbprint', 'N/A')[:20]}...</td>
-                    <td>{ca.get('NotBefore', 'N/A')}</td>
-                    <td>{ca.get('NotAfter', 'N/A')}</td>
-                    <td>{expired_badge}</td>
-                </tr>
-            """)
-        
-        return f"""
-        <div class="section">
-            <div class="section-header">
-                <h2><span class="section-icon">▸</span> Certificate Authorities ({len(cas)})</h2>
-                <span class="section-toggle">▼</span>
-            </div>
-            <div class="section-content">
+            expired_badge = BADGE_EXPIRED if ca.get('IsExpired') else BADGE_VALID
+            # Long thumbprints are cut to 20 characters; the ellipsis only marks a real cut
+            thumbprint = ca.get('Thumbprint') or 'N/A'
+            if len(thumbprint) > 20:
+                thumbprint = f"{thumbprint[:20]}..."
+            thumbprint = esc(thumbprint)
+            write(CA_ROW_TEMPLATE.format_map(RowFields(ca, thumbprint=thumbprint, expired_badge=expired_badge)))
+        
+        return section(f"Certificate Authorities ({len(cas)})", f"""
                 <div class="table-container">
                     <table class="data-table">
                         <thead>
@@ -2476,41 +1932,29 @@ class ADAuditReportGenerator:
                             </tr>
                         </thead>
                         <tbody>
-                            {''.join(rows)}
+                            {buf.getvalue()}
                         </tbody>
                     </table>
-                </div>
-            </div>
-        </div>
-        """
+                </div>""")
     
-    def generate_certificate_templates_table(self) -> str:
+    @section_data('CertificateTemplates')
+    def generate_certificate_templates_table(self, templates: List[Dict[str, Any]]) -> str:
         """Generate certificate templates table"""
-        templates = self.data.get('CertificateTemplates', [])
-        
-        if not templates:
-            return ""
-        
-        rows = []
+        buf = io.StringIO()
+        write = buf.write
         for template in templates:
-            auto_enroll_badge = '<span class="badge badge-yellow">Auto-Enroll</span>' if template.get('AutoEnrollment') else '<span class="badge badge-gray">Manual</span>'
-            approval_badge = '<span class="badge badge-green">Required</span>' if template.get('RequiresManagerApproval') else '<span class="badge badge-red">Not Required</span>'
-            rows.append(f"""
+            auto_enroll_badge = BADGE_AUTO_ENROLL if template.get('AutoEnrollment') else BADGE_MANUAL
+            approval_badge = BADGE_REQUIRED_GREEN if template.get('RequiresManagerApproval') else BADGE_NOT_REQUIRED_RED
+            write(f"""
                 <tr>
-                    <td>{template.get('Name', 'N/A')}</td>
-                    <td>{template.get('DisplayName', 'N/A')}</td>
+                    <td>{esc(template.get('Name', 'N/A'))}</td>
+                    <td>{esc(template.get('DisplayName', 'N/A'))}</td>
                     <td>{auto_enroll_badge}</td>
                     <td>{approval_badge}</td>
                 </tr>
             """)
         
-        return f"""
-        <div class="section">
-            <div class="section-header">
-                <h2><span class="section-icon">▸</span> Certificate Templates ({len(templates)})</h2>
-                <span class="section-toggle">▼</span>
-            </div>
-            <div class="section-content">
+        return section(f"Certificate Templates ({len(templates)})", f"""
                 <div class="table-container">
                     <table class="data-table">
                         <thead>
@@ -2522,38 +1966,18 @@ class ADAuditReportGenerator:
                             </tr>
                         </thead>
                         <tbody>
-                            {''.join(rows)}
-                        </tbody>
-                    </table>
-                </div>
-            </div>
-        </div>
-        """
-    
-    def generate_empty_groups_table(self) -> str:
-        """Generate empty groups table"""
-        groups = self.data.get('EmptyGroups', [])
-        
-        if not groups:
-            return ""
-        
-        rows = []
-        for group in groups[:50]:  # Limit to 50 for display
-            rows.append(f"""
-                <tr>
-                    <td>{group.get('Name', 'N/A')}</td>
-                    <td>{group.get('GroupScope', 'N/A')}</td>
-                    <td>{group.get('GroupCategory', 'N/A')}</td>
-                </tr>
-            """)
+                            {buf.getvalue()}
+                        </tbody>
+                    </table>
+                </div>""")
+    
+    @section_data('EmptyGroups')
+    def generate_empty_groups_table(self, groups: List[Dict[str, Any]]) -> str:
+        """Generate empty groups table"""
+        # Rows have no badges, so the template is mapped straight over the first 50 (display limit)
+        rows = ''.join(map(EMPTY_GROUP_ROW_TEMPLATE.format_map, map(RowFields, islice(groups, 50))))
         
-        return f"""
-        <div class="section">
-            <div class="section-header">
-                <h2><span class="section-icon">▸</span> Empty Security Groups ({len(groups)})</h2>
-                <span class="section-toggle">▼</span>
-            </div>
-            <div class="section-content">
+        return section(f"Empty Security Groups ({len(groups)})", f"""
                 <div class="alert alert-info">
                     <strong>Note:</strong> Empty groups may indicate unused groups that should be reviewed for removal.
                 </div>
@@ -2567,39 +1991,28 @@ class ADAuditReportGenerator:
                             </tr>
                         </thead>
                         <tbody>
-                            {''.join(rows)}
+                            {rows}
                         </tbody>
                     </table>
                 </div>
-                {f'<p style="margin-top: 10px; color: #6c757d;">Showing first 50 of {len(groups)} empty groups</p>' if len(groups) > 50 else ''}
-            </div>
-        </div>
-        """
+                {f'<p style="margin-top: 10px; color: #6c757d;">Showing first 50 of {len(groups)} empty groups</p>' if len(groups) > 50 else ''}""")
     
-    def generate_large_groups_table(self) -> str:
+    @section_data('LargeGroups')
+    def generate_large_groups_table(self, groups: List[Dict[str, Any]]) -> str:
         """Generate large groups table"""
-        groups = self.data.get('LargeGroups', [])
-        
-        if not groups:
-            return ""
-        
-        rows = []
-        for group in sorted(groups, key=lambda x: x.get('MemberCount', 0), reverse=True):
-            rows.append(f"""
+        buf = io.StringIO()
+        write = buf.write
+        # Only the top TABLE_ROW_CAP rows are shown; nlargest keeps a bounded heap instead of sorting all
+        for group in heapq.nlargest(TABLE_ROW_CAP, groups, key=lambda x: x.get('MemberCount', 0)):
+            write(f"""
                 <tr>
-                    <td>{group.get('Name', 'N/A')}</td>
+                    <td>{esc(group.get('Name', 'N/A'))}</td>
                     <td>{group.get('MemberCount', 0):,}</td>
-                    <td>{group.get('GroupScope', 'N/A')}</td>
+                    <td>{esc(group.get('GroupScope', 'N/A'))}</td>
                 </tr>
             """)
         
-        return f"""
-        <div class="section">
-            <div class="section-header">
-                <h2><span class="section-icon">▸</span> Large Security Groups ({len(groups)})</h2>
-                <span class="section-toggle">▼</span>
-            </div>
-            <div class="section-content">
+        return section(f"Large Security Groups ({len(groups)})", f"""
                 <div class="alert alert-warning">
                     <strong>Security Note:</strong> Groups with >1000 members may indicate over-privileged access. Review for least privilege.
                 </div>
@@ -2613,45 +2026,25 @@ class ADAuditReportGenerator:
                             </tr>
                         </thead>
                         <tbody>
-                            {''.join(rows)}
+                            {buf.getvalue()}
                         </tbody>
                     </table>
                 </div>
-            </div>
-        </div>
-        """
+                {f'<p style="margin-top: 10px; color: #6c757d;">Showing top {TABLE_ROW_CAP} of {len(groups)} large groups</p>' if len(groups) > TABLE_ROW_CAP else ''}""")
     
-    def generate_suspicious_accounts_table(self) -> str:
+    @section_data('SuspiciousAccounts')
+    def generate_suspicious_accounts_table(self, accounts: List[Dict[str, Any]]) -> str:
         """Generate suspicious accounts table"""
-        accounts = self.data.get('SuspiciousAccounts', [])
-        
-        if not accounts:
-            return ""
-        
-        rows = []
-        for account in accounts:
-            reasons = '<br>'.join(account.get('Reasons', []))
-            member_of_list = account.get('MemberOf') or []
-            member_of = ', '.join(member_of_list[:3]) if member_of_list else 'None'
-            if len(member_of_list) > 3:
-                member_of += f" (+{len(member_of_list) - 3} more)"
-            rows.append(f"""
-                <tr>
-                    <td>{account.get('SamAccountName', 'N/A')}</td>
-                    <td>{account.get('DisplayName', 'N/A')}</td>
-                    <td>{'<span class="badge badge-green">Enabled</span>' if account.get('Enabled') else '<span class="badge badge-red">Disabled</span>'}</td>
-                    <td>{reasons}</td>
-                    <td>{member_of}</td>
-                </tr>
-            """)
-        
-        return f"""
-        <div class="section">
-            <div class="section-header">
-                <h2><span class="section-icon">▸</span> Suspicious Accounts ({len(accounts)})</h2>
-                <span class="section-toggle">▼</span>
-            </div>
-            <div class="section-content">
+        buf = io.StringIO()
+        write = buf.write
+        for account in islice(accounts, TABLE_ROW_CAP):
+            reasons = '<br>'.join([esc(r) for r in account.get('Reasons', ())])
+            enabled_badge = BADGE_ENABLED_GREEN if account.get('Enabled') else BADGE_DISABLED_RED
+            member_of = esc(fmt_member_of(account.get('MemberOf')))
+            write(SUSPICIOUS_ROW_TEMPLATE.format_map(
+                RowFields(account, enabled_badge=enabled_badge, reasons=reasons, member_of=member_of)))
+        
+        return section(f"Suspicious Accounts ({len(accounts)})", f"""
                 <div class="alert alert-warning">
                     <strong>Security Alert:</strong> These accounts have security issues that require immediate review.
                 </div>
@@ -2667,49 +2060,27 @@ class ADAuditReportGenerator:
                             </tr>
                         </thead>
                         <tbody>
-                            {''.join(rows)}
+                            {buf.getvalue()}
                         </tbody>
                     </table>
                 </div>
-            </div>
-        </div>
-        """
+                {f'<p style="margin-top: 10px; color: #6c757d;">Showing first {TABLE_ROW_CAP} of {len(accounts)} suspicious accounts</p>' if len(accounts) > TABLE_ROW_CAP else ''}""")
     
-    def generate_failed_logons_table(self) -> str:
+    @section_data('FailedLogons')
+    def generate_failed_logons_table(self, failed_logons: List[Dict[str, Any]]) -> str:
         """Generate failed logon attempts table"""
-        failed_logons = self.data.get('FailedLogons', [])
-        
-        if not failed_logons:
-            return ""
-        
         # Group by account
-        account_counts = {}
-        for logon in failed_logons:
-            account = f"{logon.get('AccountDomain', '')}\\{logon.get('AccountName', 'N/A')}"
-            account_counts[account] = account_counts.get(account, 0) + 1
+        accounts = [f"{logon.get('AccountDomain', '')}\\{logon.get('AccountName', 'N/A')}"
+                    for logon in failed_logons]
         
-        top_accounts = sorted(account_counts.items(), key=lambda x: x[1], reverse=True)[:10]
+        top_accounts = Counter(accounts).most_common(10)
         
-        rows = []
-        for logon in failed_logons[:50]:  # Limit to 50 for display
-            account = f"{logon.get('AccountDomain', '')}\\{logon.get('AccountName', 'N/A')}"
-            rows.append(f"""
-                <tr>
-                    <td>{logon.get('TimeCreated', 'N/A')}</td>
-                    <td>{account}</td>
-                    <td>{logon.get('IPAddress', 'N/A')}</td>
-                    <td>{logon.get('WorkstationName', 'N/A')}</td>
-                    <td>{logon.get('FailureReason', 'N/A')}</td>
-                </tr>
-            """)
+        buf = io.StringIO()
+        write = buf.write
+        for logon, account in zip(failed_logons[:50], accounts):  # Limit to 50 for display
+            write(FAILED_LOGON_ROW_TEMPLATE.format_map(RowFields(logon, account=esc(account))))
         
-        return f"""
-        <div class="section">
-            <div class="section-header">
-                <h2><span class="section-icon">▸</span> Failed Logon Attempts ({len(failed_logons)})</h2>
-                <span class="section-toggle">▼</span>
-            </div>
-            <div class="section-content">
+        return section(f"Failed Logon Attempts ({len(failed_logons)})", f"""
                 {f'''
                 <div style="margin-bottom: 20px;">
                     <h3 style="font-size: 14px; margin-bottom: 10px; color: #495057;">Top Accounts with Failed Logons</h3>
@@ -2721,7 +2092,7 @@ class ADAuditReportGenerator:
                             </tr>
                         </thead>
                         <tbody>
-                            {''.join([f'<tr><td>{acc}</td><td>{count}</td></tr>' for acc, count in top_accounts])}
+                            {count_rows(top_accounts)}
                         </tbody>
                     </table>
                 </div>
@@ -2738,39 +2109,29 @@ class ADAuditReportGenerator:
                             </tr>
                         </thead>
                         <tbody>
-                            {''.join(rows)}
+                            {buf.getvalue()}
                         </tbody>
                     </table>
                 </div>
-                {f'<p style="margin-top: 10px; color: #6c757d;">Showing first 50 of {len(failed_logons)} failed logon attempts</p>' if len(failed_logons) > 50 else ''}
-            </div>
-        </div>
-        """
+                {f'<p style="margin-top: 10px; color: #6c757d;">Showing first 50 of {len(failed_logons)} failed logon attempts</p>' if len(failed_logons) > 50 else ''}""")
     
-    def generate_nested_groups_table(self) -> str:
+    @section_data('NestedGroups')
+    def generate_nested_groups_table(self, groups: List[Dict[str, Any]]) -> str:
         """Generate nested groups table"""
-        groups = self.data.get('NestedGroups', [])
-        
-        if not groups:
-            return ""
-        
-        rows = []
-        for group in sorted(groups, key=lambda x: x.get('NestingDepth', 0), reverse=True):
-            rows.append(f"""
+        buf = io.StringIO()
+        write = buf.write
+        # Only the top TABLE_ROW_CAP rows are shown; nlargest keeps a bounded heap instead of sorting all
+        for group in heapq.nlargest(TABLE_ROW_CAP, groups, key=lambda x: x.get('NestingDepth', 0)):
+            depth = group.get('NestingDepth', 0)
+            write(f"""
                 <tr>
-                    <td>{group.get('GroupName', 'N/A')}</td>
-                    <td>{group.get('NestingDepth', 0)}</td>
-                    <td>{'<span class="badge badge-red">High</span>' if group.get('NestingDepth', 0) >= 7 else '<span class="badge badge-yellow">Medium</span>'}</td>
+                    <td>{esc(group.get('GroupName', 'N/A'))}</td>
+                    <td>{depth}</td>
+                    <td>{BADGE_HIGH if depth >= 7 else BADGE_MEDIUM}</td>
                 </tr>
             """)
         
-        return f"""
-        <div class="section">
-            <div class="section-header">
-                <h2><span class="section-icon">▸</span> Deeply Nested Groups ({len(groups)})</h2>
-                <span class="section-toggle">▼</span>
-            </div>
-            <div class="section-content">
+        return section(f"Deeply Nested Groups ({len(groups)})", f"""
                 <div class="alert alert-warning">
                     <strong>Security Note:</strong> Groups with deep nesting (>=5 levels) can be difficult to manage and may indicate over-complex permission structures.
                 </div>
@@ -2784,41 +2145,23 @@ class ADAuditReportGenerator:
                             </tr>
                         </thead>
                         <tbody>
-                            {''.join(rows)}
+                            {buf.getvalue()}
                         </tbody>
                     </table>
                 </div>
-            </div>
-        </div>
-        """
+                {f'<p style="margin-top: 10px; color: #6c757d;">Showing top {TABLE_ROW_CAP} of {len(groups)} nested groups</p>' if len(groups) > TABLE_ROW_CAP else ''}""")
     
-    def generate_outdated_computers_table(self) -> str:
+    @section_data('OutdatedComputers')
+    def generate_outdated_computers_table(self, computers: List[Dict[str, Any]]) -> str:
         """Generate outdated computers table"""
-        computers = self.data.get('OutdatedComputers', [])
-        
-        if not computers:
-            return ""
-        
-        rows = []
-        for comp in computers:
-            enabled_badge = '<span class="badge badge-green">Enabled</span>' if comp.get('Enabled') else '<span class="badge badge-red">Disabled</span>'
-            rows.append(f"""
-                <tr>
-                    <td>{comp.get('SamAccountName', 'N/A').replace('$', '')}</td>
-                    <td>{comp.get('OperatingSystem', 'N/A')}</td>
-                    <td>{comp.get('OperatingSystemVersion', 'N/A')}</td>
-                    <td><span class="badge badge-red">{comp.get('Reason', 'N/A')}</span></td>
-                    <td>{enabled_badge}</td>
-                </tr>
-            """)
-        
-        return f"""
-        <div class="section">
-            <div class="section-header">
-                <h2><span class="section-icon">▸</span> Outdated Computers ({len(computers)})</h2>
-                <span class="section-toggle">▼</span>
-            </div>
-            <div class="section-content">
+        buf = io.StringIO()
+        write = buf.write
+        for comp in islice(computers, TABLE_ROW_CAP):
+            enabled_badge = BADGE_ENABLED_GREEN if comp.get('Enabled') else BADGE_DISABLED_RED
+            name = esc((comp.get('SamAccountName') or 'N/A').rstrip('$'))
+            write(OUTDATED_ROW_TEMPLATE.format_map(RowFields(comp, name=name, enabled_badge=enabled_badge)))
+        
+        return section(f"Outdated Computers ({len(computers)})", f"""
                 <div class="alert alert-warning">
                     <strong>Security Alert:</strong> Outdated operating systems are no longer supported and may have unpatched vulnerabilities.
                 </div>
@@ -2834,39 +2177,22 @@ class ADAuditReportGenerator:
                             </tr>
                         </thead>
                         <tbody>
-                            {''.join(rows)}
+                            {buf.getvalue()}
                         </tbody>
                     </table>
                 </div>
-            </div>
-        </div>
-        """
+                {f'<p style="margin-top: 10px; color: #6c757d;">Showing first {TABLE_ROW_CAP} of {len(computers)} outdated computers</p>' if len(computers) > TABLE_ROW_CAP else ''}""")
     
-    def generate_service_account_issues_table(self) -> str:
+    @section_data('ServiceAccountIssues')
+    def generate_service_account_issues_table(self, issues: List[Dict[str, Any]]) -> str:
         """Generate service account issues table"""
-        issues = self.data.get('ServiceAccountIssues', [])
-        
-        if not issues:
-            return ""
-        
-        rows = []
-        for issue in issues:
-            issues_list = '<br>'.join([f'• {i}' for i in issue.get('Issues', [])])
-            rows.append(f"""
-                <tr>
-                    <td>{issue.get('SamAccountName', 'N/A')}</td>
-                    <td>{issue.get('DisplayName', 'N/A')}</td>
-                    <td>{issues_list}</td>
-                </tr>
-            """)
+        buf = io.StringIO()
+        write = buf.write
+        for issue in islice(issues, TABLE_ROW_CAP):
+            issues_list = '<br>'.join([f'• {esc(i)}' for i in issue.get('Issues', ())])
+            write(SERVICE_ISSUE_ROW_TEMPLATE.format_map(RowFields(issue, issues_list=issues_list)))
         
-        return f"""
-        <div class="section">
-            <div class="section-header">
-                <h2><span class="section-icon">▸</span> Service Account Security Issues ({len(issues)})</h2>
-                <span class="section-toggle">▼</span>
-            </div>
-            <div class="section-content">
+        return section(f"Service Account Security Issues ({len(issues)})", f"""
                 <div class="alert alert-warning">
                     <strong>Security Note:</strong> Service accounts should use gMSA or have PasswordNeverExpires set. They should not be in privileged groups.
                 </div>
@@ -2880,39 +2206,22 @@ class ADAuditReportGenerator:
                             </tr>
                         </thead>
                         <tbody>
-                            {''.join(rows)}
+                            {buf.getvalue()}
                         </tbody>
                     </table>
                 </div>
-            </div>
-        </div>
-        """
+                {f'<p style="margin-top: 10px; color: #6c757d;">Showing first {TABLE_ROW_CAP} of {len(issues)} service account issues</p>' if len(issues) > TABLE_ROW_CAP else ''}""")
     
-    def generate_gpo_issues_table(self) -> str:
+    @section_data('GPOIssues')
+    def generate_gpo_issues_table(self, issues: List[Dict[str, Any]]) -> str:
         """Generate GPO issues table"""
-        issues = self.data.get('GPOIssues', [])
-        
-        if not issues:
-            return ""
-        
-        rows = []
-        for issue in issues:
-            severity_badge = '<span class="badge badge-red">High</span>' if issue.get('Severity') == 'high' else '<span class="badge badge-yellow">Medium</span>'
-            rows.append(f"""
-                <tr>
-                    <td>{issue.get('GPO', 'N/A')}</td>
-                    <td>{issue.get('Issue', 'N/A')}</td>
-                    <td>{severity_badge}</td>
-                </tr>
-            """)
+        buf = io.StringIO()
+        write = buf.write
+        for issue in islice(issues, TABLE_ROW_CAP):
+            severity_badge = BADGE_HIGH if issue.get('Severity') == 'high' else BADGE_MEDIUM
+            write(GPO_ISSUE_ROW_TEMPLATE.format_map(RowFields(issue, severity_badge=severity_badge)))
         
-        return f"""
-        <div class="section">
-            <div class="section-header">
-                <h2><span class="section-icon">▸</span> GPO Issues ({len(issues)})</h2>
-                <span class="section-toggle">▼</span>
-            </div>
-            <div class="section-content">
+        return section(f"GPO Issues ({len(issues)})", f"""
                 <div class="table-container">
                     <table class="data-table">
                         <thead>
@@ -2923,28 +2232,16 @@ class ADAuditReportGenerator:
                             </tr>
                         </thead>
                         <tbody>
-                            {''.join(rows)}
+                            {buf.getvalue()}
                         </tbody>
                     </table>
                 </div>
-            </div>
-        </div>
-        """
+                {f'<p style="margin-top: 10px; color: #6c757d;">Showing first {TABLE_ROW_CAP} of {len(issues)} GPO issues</p>' if len(issues) > TABLE_ROW_CAP else ''}""")
     
-    def generate_kerberos_policy_table(self) -> str:
+    @section_data('KerberosPolicy')
+    def generate_kerberos_policy_table(self, policy: Dict[str, Any]) -> str:
         """Generate Kerberos policy table"""
-        policy = self.data.get('KerberosPolicy')
-        
-        if not policy:
-            return ""
-        
-        return f"""
-        <div class="section">
-            <div class="section-header">
-                <h2><span class="section-icon">▸</span> Kerberos Policy</h2>
-                <span class="section-toggle">▼</span>
-            </div>
-            <div class="section-content">
+        return section("Kerberos Policy", f"""
                 <table class="data-table">
                     <tbody>
                         <tr><td><strong>Max Clock Skew</strong></td><td>{policy.get('MaxClockSkew', 'N/A')} minutes</td></tr>
@@ -2952,28 +2249,15 @@ class ADAuditReportGenerator:
                         <tr><td><strong>Max Ticket Age</strong></td><td>{policy.get('MaxTicketAge', 'N/A')} hours</td></tr>
                         <tr><td><strong>Max Renew Age</strong></td><td>{policy.get('MaxRenewAge', 'N/A')} days</td></tr>
                     </tbody>
-                </table>
-            </div>
-        </div>
-        """
+                </table>""")
     
-    def generate_anonymous_access_table(self) -> str:
+    @section_data('AnonymousAccess')
+    def generate_anonymous_access_table(self, anon: Dict[str, Any]) -> str:
         """Generate anonymous access settings table"""
-        anon = self.data.get('AnonymousAccess')
-        
-        if not anon:
-            return ""
-        
         anon_enabled = anon.get('AnonymousAccessEnabled')
         anon_badge = '<span class="badge badge-red">Enabled</span>' if anon_enabled else '<span class="badge badge-green">Restricted</span>' if anon_enabled is False else '<span class="badge badge-gray">Unknown</span>'
         
-        return f"""
-        <div class="section">
-            <div class="section-header">
-                <h2><span class="section-icon">▸</span> Anonymous Access Settings</h2>
-                <span class="section-toggle">▼</span>
-            </div>
-            <div class="section-content">
+        return section("Anonymous Access Settings", f"""
                 <table class="data-table">
                     <tbody>
                         <tr><td><strong>Anonymous Access</strong></td><td>{anon_badge}</td></tr>
@@ -2982,37 +2266,19 @@ class ADAuditReportGenerator:
                 </table>
                 <div class="alert alert-warning" style="margin-top: 15px;">
                     <strong>Security Note:</strong> Anonymous access should be restricted to prevent information disclosure.
-                </div>
-            </div>
-        </div>
-        """
+                </div>""")
     
-    def generate_smbv1_usage_table(self) -> str:
+    @section_data('SMBv1Usage')
+    def generate_smbv1_usage_table(self, usage: List[Dict[str, Any]]) -> str:
         """Generate SMBv1 usage table"""
-        usage = self.data.get('SMBv1Usage', [])
-        
-        if not usage:
-            return ""
-        
-        rows = []
+        buf = io.StringIO()
+        write = buf.write
         for item in usage:
-            client_badge = '<span class="badge badge-red">Enabled</span>' if item.get('SMBv1ClientEnabled') else '<span class="badge badge-green">Disabled</span>'
-            server_badge = '<span class="badge badge-red">Enabled</span>' if item.get('SMBv1ServerEnabled') else '<span class="badge badge-green">Disabled</span>'
-            rows.append(f"""
-                <tr>
-                    <td>{item.get('ComputerName', 'N/A')}</td>
-                    <td>{client_badge}</td>
-                    <td>{server_badge}</td>
-                </tr>
-            """)
+            client_badge = BADGE_ENABLED_RED if item.get('SMBv1ClientEnabled') else BADGE_DISABLED_GREEN
+            server_badge = BADGE_ENABLED_RED if item.get('SMBv1ServerEnabled') else BADGE_DISABLED_GREEN
+            write(SMBV1_ROW_TEMPLATE.format_map(RowFields(item, client_badge=client_badge, server_badge=server_badge)))
         
-        return f"""
-        <div class="section">
-            <div class="section-header">
-                <h2><span class="section-icon">▸</span> SMBv1 Usage ({len(usage)})</h2>
-                <span class="section-toggle">▼</span>
-            </div>
-            <div class="section-content">
+        return section(f"SMBv1 Usage ({len(usage)})", f"""
                 <div class="alert alert-warning">
                     <strong>Security Alert:</strong> SMBv1 is vulnerable and should be disabled. It was used in WannaCry and other ransomware attacks.
                 </div>
@@ -3026,13 +2292,10 @@ class ADAuditReportGenerator:
                             </tr>
                         </thead>
                         <tbody>
-                            {''.join(rows)}
+                            {buf.getvalue()}
                         </tbody>
                     </table>
-                </div>
-            </div>
-        </div>
-        """
+                </div>""")
     
     def generate_rdp_winrm_table(self) -> str:
         """Generate RDP and WinRM settings table"""
@@ -3042,35 +2305,31 @@ class ADAuditReportGenerator:
         if not rdp and not winrm:
             return ""
         
-        rows = []
-        all_computers = set()
-        for item in rdp:
-            all_computers.add(item.get('ComputerName', 'N/A'))
-        for item in winrm:
-            all_computers.add(item.get('ComputerName', 'N/A'))
+        buf = io.StringIO()
+        write = buf.write
+        # Ordered union of computer names: RDP entries first, then WinRM-only ones
+        all_computers = dict.fromkeys([item.get('ComputerName', 'N/A') for item in chain(rdp, winrm)])
+        
+        # Index by name once; reversed() so the first entry per computer wins, as a linear scan would
+        rdp_by_name = {x.get('ComputerName'): x for x in reversed(rdp)}
+        winrm_by_name = {x.get('ComputerName'): x for x in reversed(winrm)}
         
         for comp in all_computers:
-            rdp_item = next((x for x in rdp if x.get('ComputerName') == comp), None)
-            winrm_item = next((x for x in winrm if x.get('ComputerName') == comp), None)
+            rdp_item = rdp_by_name.get(comp)
+            winrm_item = winrm_by_name.get(comp)
             
-            rdp_badge = '<span class="badge badge-yellow">Enabled</span>' if rdp_item and rdp_item.get('Enabled') else '<span class="badge badge-gray">Unknown</span>'
-            winrm_badge = '<span class="badge badge-yellow">Enabled</span>' if winrm_item and winrm_item.get('Enabled') else '<span class="badge badge-gray">Unknown</span>'
+            rdp_badge = BADGE_ENABLED_YELLOW if rdp_item and rdp_item.get('Enabled') else BADGE_UNKNOWN
+            winrm_badge = BADGE_ENABLED_YELLOW if winrm_item and winrm_item.get('Enabled') else BADGE_UNKNOWN
             
-            rows.append(f"""
+            write(f"""
                 <tr>
-                    <td>{comp}</td>
+                    <td>{esc(comp)}</td>
                     <td>{rdp_badge}</td>
                     <td>{winrm_badge}</td>
                 </tr>
             """)
         
-        return f"""
-        <div class="section">
-            <div class="section-header">
-                <h2><span class="section-icon">▸</span> Remote Access (RDP/WinRM)</h2>
-                <span class="section-toggle">▼</span>
-            </div>
-            <div class="section-content">
+        return section("Remote Access (RDP/WinRM)", f"""
                 <div class="alert alert-info">
                     <strong>Note:</strong> Remote access should be properly secured with strong authentication and network restrictions.
                 </div>
@@ -3084,21 +2343,14 @@ class ADAuditReportGenerator:
                             </tr>
                         </thead>
                         <tbody>
-                            {''.join(rows)}
+                            {buf.getvalue()}
                         </tbody>
                     </table>
-                </div>
-            </div>
-        </div>
-        """
+                </div>""")
     
-    def generate_event_log_settings_table(self) -> str:
+    @section_data('EventLogSettings')
+    def generate_event_log_settings_table(self, settings: Dict[str, Any]) -> str:
         """Generate event log settings table"""
-        settings = self.data.get('EventLogSettings')
-        
-        if not settings:
-            return ""
-        
         retention_map = {
             'Circular': 'Overwrites old events',
             'Retain': 'Retains events',
@@ -3108,51 +2360,25 @@ class ADAuditReportGenerator:
         max_size_bytes = settings.get('SecurityLogMaxSize', 0) or 0
         max_size_mb = max_size_bytes / (1024 * 1024) if max_size_bytes > 0 else 0
         
-        return f"""
-        <div class="section">
-            <div class="section-header">
-                <h2><span class="section-icon">▸</span> Event Log Settings</h2>
-                <span class="section-toggle">▼</span>
-            </div>
-            <div class="section-content">
+        return section("Event Log Settings", f"""
                 <table class="data-table">
                     <tbody>
                         <tr><td><strong>Security Log Max Size</strong></td><td>{max_size_mb:.2f} MB</td></tr>
-                        <tr><td><strong>Security Log Retention</strong></td><td>{retention}</td></tr>
-                        <tr><td><strong>Security Log Enabled</strong></td><td>{'<span class="badge badge-green">Yes</span>' if settings.get('SecurityLogEnabled') else '<span class="badge badge-red">No</span>'}</td></tr>
+                        <tr><td><strong>Security Log Retention</strong></td><td>{esc(retention)}</td></tr>
+                        <tr><td><strong>Security Log Enabled</strong></td><td>{BADGE_YES_GREEN if settings.get('SecurityLogEnabled') else BADGE_NO_RED}</td></tr>
                     </tbody>
-                </table>
-            </div>
-        </div>
-        """
+                </table>""")
     
-    def generate_gpo_settings_table(self) -> str:
+    @section_data('GPOSettings')
+    def generate_gpo_settings_table(self, gpos: List[Dict[str, Any]]) -> str:
         """Generate GPO settings table"""
-        gpos = self.data.get('GPOSettings', [])
-        
-        if not gpos:
-            return ""
-        
-        rows = []
+        buf = io.StringIO()
+        write = buf.write
         for gpo in gpos[:50]:  # Limit to 50 for display
-            enabled_badge = '<span class="badge badge-green">Enabled</span>' if gpo.get('Enabled') else '<span class="badge badge-yellow">Disabled</span>'
-            rows.append(f"""
-                <tr>
-                    <td>{gpo.get('DisplayName', 'N/A')}</td>
-                    <td>{gpo.get('GUID', 'N/A')}</td>
-                    <td>{gpo.get('Created', 'N/A')}</td>
-                    <td>{gpo.get('Modified', 'N/A')}</td>
-                    <td>{enabled_badge}</td>
-                </tr>
-            """)
+            enabled_badge = BADGE_ENABLED_GREEN if gpo.get('Enabled') else BADGE_DISABLED_YELLOW
+            write(GPO_ROW_TEMPLATE.format_map(RowFields(gpo, enabled_badge=enabled_badge)))
         
-        return f"""
-        <div class="section">
-            <div class="section-header">
-                <h2><span class="section-icon">▸</span> Group Policy Objects ({len(gpos)})</h2>
-                <span class="section-toggle">▼</span>
-            </div>
-            <div class="section-content">
+        return section(f"Group Policy Objects ({len(gpos)})", f"""
                 <div class="table-container">
                     <table class="data-table">
                         <thead>
@@ -3165,29 +2391,20 @@ class ADAuditReportGenerator:
                             </tr>
                         </thead>
                         <tbody>
-                            {''.join(rows)}
+                            {buf.getvalue()}
                         </tbody>
                     </table>
                 </div>
-                {f'<p style="margin-top: 10px; color: #6c757d;">Showing first 50 of {len(gpos)} GPOs</p>' if len(gpos) > 50 else ''}
-            </div>
-        </div>
-        """
+                {f'<p style="margin-top: 10px; color: #6c757d;">Showing first 50 of {len(gpos)} GPOs</p>' if len(gpos) > 50 else ''}""")
     
     def generate_computer_security_status_table(self) -> str:
         """Generate computer security status table (AV, BitLocker, Firewall)"""
         security_status = self.data.get('ComputerSecurityStatus', [])
-        total_computers = len(self.data.get('Computers', []))
-        enabled_computers = len([c for c in self.data.get('Computers', []) if c.get('Enabled')])
+        total_computers = len(self._computers)
+        enabled_computers = sum(1 for c in self._computers if c.get('Enabled'))
         
         if not security_status or len(security_status) == 0:
-            return f"""
-        <div class="section">
-            <div class="section-header">
-                <h2><span class="section-icon">▸</span> Computer Security Status (0 checked)</h2>
-                <span class="section-toggle">▼</span>
-            </div>
-            <div class="section-content">
+            return section("Computer Security Status (0 checked)", f"""
                 <div class="alert alert-warning">
                     <strong>No Computer Security Data Collected</strong>
                     <p style="margin-top: 10px;">Computer security status (Antivirus, BitLocker, Firewall, Windows Update) was not collected.</p>
@@ -3208,46 +2425,36 @@ class ADAuditReportGenerator:
                         <li>Verify computers are online and reachable</li>
                         <li>Check that Windows Firewall allows WMI/CIM connections (ports 135, 445, 5985, 5986)</li>
                     </ol>
-                </div>
-            </div>
-        </div>
-        """
+                </div>""")
         
-        rows = []
+        buf = io.StringIO()
+        write = buf.write
         for comp in security_status:
             av = comp.get('Antivirus', {})
             bitlocker = comp.get('BitLocker', {})
             firewall = comp.get('Firewall', {})
             updates = comp.get('WindowsUpdate', {})
             
-            av_badge = '<span class="badge badge-green">Installed</span>' if av.get('Installed') else '<span class="badge badge-red">Not Found</span>' if av.get('Online') else '<span class="badge badge-gray">Offline</span>'
             if av.get('Installed') and not av.get('RealTimeProtectionEnabled'):
-                av_badge = '<span class="badge badge-yellow">No Real-time</span>'
-            
-            bitlocker_badge = '<span class="badge badge-green">Enabled</span>' if bitlocker.get('Enabled') else '<span class="badge badge-yellow">Not Enabled</span>' if bitlocker.get('Online') else '<span class="badge badge-gray">Offline</span>'
-            
-            firewall_badge = '<span class="badge badge-green">Enabled</span>' if firewall.get('Enabled') else '<span class="badge badge-red">Disabled</span>' if firewall.get('Online') else '<span class="badge badge-gray">Offline</span>'
-            
-            updates_badge = '<span class="badge badge-green">Running</span>' if updates.get('AutoUpdateEnabled') else '<span class="badge badge-yellow">Stopped</span>' if updates.get('Online') else '<span class="badge badge-gray">Offline</span>'
-            
-            rows.append(f"""
+                av_badge = BADGE_NO_REALTIME
+            else:
+                av_badge = online_badge(av, 'Installed', BADGE_INSTALLED, BADGE_NOT_FOUND)
+            bitlocker_badge = online_badge(bitlocker, 'Enabled', BADGE_ENABLED_GREEN, BADGE_NOT_ENABLED_YELLOW)
+            firewall_badge = online_badge(firewall, 'Enabled', BADGE_ENABLED_GREEN, BADGE_DISABLED_RED)
+            updates_badge = online_badge(updates, 'AutoUpdateEnabled', BADGE_RUNNING, BADGE_STOPPED)
+            
+            write(f"""
                 <tr>
-                    <td>{comp.get('ComputerName', 'N/A')}</td>
+                    <td>{esc(comp.get('ComputerName', 'N/A'))}</td>
                     <td>{av_badge}</td>
-                    <td>{av.get('ProductName', 'N/A') if av.get('Installed') else 'N/A'}</td>
+                    <td>{esc(av.get('ProductName', 'N/A')) if av.get('Installed') else 'N/A'}</td>
                     <td>{bitlocker_badge}</td>
                     <td>{firewall_badge}</td>
                     <td>{updates_badge}</td>
                 </tr>
             """)
         
-        return f"""
-        <div class="section">
-            <div class="section-header">
-                <h2><span class="section-icon">▸</span> Computer Security Status ({len(security_status)} computers)</h2>
-                <span class="section-toggle">▼</span>
-            </div>
-            <div class="section-content">
+        return section(f"Computer Security Status ({len(security_status)} computers)", f"""
                 <div class="alert alert-info">
                     <strong>Note:</strong> Security status is gathered for online computers only. Some computers may be offline or inaccessible.
                 </div>
@@ -3263,50 +2470,23 @@ class ADAuditReportGenerator:
                         </tr>
                     </thead>
                     <tbody>
-                        {''.join(rows)}
+                        {buf.getvalue()}
                     </tbody>
-                </table>
-            </div>
-        </div>
-        """
+                </table>""")
     
     def generate_recommendations(self) -> str:
         """Generate remediation recommendations"""
-        recommendations = []
-        
-        users_with_spns = len([u for u in self.data.get('Users', []) if u.get('SPNs') and len(u.get('SPNs', [])) > 0])
-        if users_with_spns > 0:
-            recommendations.append(f"<li><strong>Kerberoasting:</strong> {users_with_spns} user accounts have SPNs. Move SPNs to managed service accounts (gMSA) or use Group Managed Service Accounts.</li>")
-        
-        users_with_delegation = len([u for u in self.data.get('Users', []) if u.get('TrustedForDelegation') or u.get('TrustedToAuthForDelegation')])
-        if users_with_delegation > 0:
-            recommendations.append(f"<li><strong>Delegation:</strong> {users_with_delegation} user accounts have delegation enabled. Review and disable unnecessary delegation. Prefer constrained delegation over unconstrained.</li>")
-        
-        computers_with_delegation = len([c for c in self.data.get('Computers', []) 
-                                        if (c.get('TrustedForDelegation') or c.get('TrustedToAuthForDelegation') or 
-                                            (c.get('ConstrainedDelegation') and len(c.get('ConstrainedDelegation', [])) > 0))
-                                        and not c.get('IsDomainController', False)])
-        if computers_with_delegation > 0:
-            recommendations.append(f"<li><strong>Computer Delegation:</strong> {computers_with_delegation} non-DC computers have delegation. This is a high-risk configuration that should be reviewed.</li>")
-        
-        weak_encryption = len([u for u in self.data.get('Users', [])
-                              if any(enc in ['DES', 'RC4'] for enc in u.get('EncryptionTypes', []))
-                              or u.get('UseDESKeyOnly', False)])
-        if weak_encryption > 0:
-            recommendations.append(f"<li><strong>Weak Encryption:</strong> {weak_encryption} accounts support DES or RC4. Disable these encryption types via Group Policy and update account settings.</li>")
-        
-        domain_admins = [u for u in self.data.get('Users', []) if 'Domain Admins' in self._get_member_of(u)]
-        unprotected_admins = [u for u in domain_admins if 'Protected Users' not in self._get_member_of(u)]
-        if len(unprotected_admins) > 0:
-            recommendations.append(f"<li><strong>Privileged Accounts:</strong> {len(unprotected_admins)} Domain/Enterprise Admins are not in Protected Users group. Add them to reduce credential theft risk.</li>")
-        
-        inactive = len([u for u in self.data.get('Users', []) if u.get('DaysSinceLastLogon') and u.get('DaysSinceLastLogon') > 90])
-        if inactive > 0:
-            recommendations.append(f"<li><strong>Inactive Accounts:</strong> {inactive} accounts haven't logged in for 90+ days. Review and disable/remove if no longer needed.</li>")
-        
-        old_passwords = len([u for u in self.data.get('Users', []) if u.get('DaysSincePasswordChange') and u.get('DaysSincePasswordChange') > 365])
-        if old_passwords > 0:
-            recommendations.append(f"<li><strong>Password Age:</strong> {old_passwords} accounts have passwords older than 365 days. Enforce password rotation policies.</li>")
+        # Account findings: (affected count, message), listed when the count is non-zero
+        account_findings = [
+            (len(self._spn_users), "<li><strong>Kerberoasting:</strong> {} user accounts have SPNs. Move SPNs to managed service accounts (gMSA) or use Group Managed Service Accounts.</li>"),
+            (len(self._deleg_users), "<li><strong>Delegation:</strong> {} user accounts have delegation enabled. Review and disable unnecessary delegation. Prefer constrained delegation over unconstrained.</li>"),
+            (len(self._deleg_computers), "<li><strong>Computer Delegation:</strong> {} non-DC computers have delegation. This is a high-risk configuration that should be reviewed.</li>"),
+            (len(self._weak_enc_users), "<li><strong>Weak Encryption:</strong> {} accounts support DES or RC4. Disable these encryption types via Group Policy and update account settings.</li>"),
+            (self._count_users(USER_DOMAIN_ADMIN, USER_PROTECTED), "<li><strong>Privileged Accounts:</strong> {} Domain/Enterprise Admins are not in Protected Users group. Add them to reduce credential theft risk.</li>"),
+            (len(self._inactive), "<li><strong>Inactive Accounts:</strong> {} accounts haven't logged in for 90+ days. Review and disable/remove if no longer needed.</li>"),
+            (len(self._old_pwd), "<li><strong>Password Age:</strong> {} accounts have passwords older than 365 days. Enforce password rotation policies.</li>")
+        ]
+        recommendations = [message.format(count) for count, message in account_findings if count > 0]
         
         krbtgt = self.data.get('KrbtgtInfo')
         if krbtgt and krbtgt.get('DaysSincePasswordChange', 0) > 180:
@@ -3328,23 +2508,30 @@ class ADAuditReportGenerator:
         trusts = self.data.get('TrustRelationships', [])
         for trust in trusts:
             if not trust.get('SIDFilteringForestAware'):
-                recommendations.append(f"<li><strong>Trust Relationship:</strong> SID filtering is disabled for trust '{trust.get('Name')}'. Enable SID filtering to prevent SID history attacks.</li>")
+                recommendations.append(f"<li><strong>Trust Relationship:</strong> SID filtering is disabled for trust '{esc(trust.get('Name'))}'. Enable SID filtering to prevent SID history attacks.</li>")
             if not trust.get('SelectiveAuthentication'):
-                recommendations.append(f"<li><strong>Trust Relationship:</strong> Selective authentication is disabled for trust '{trust.get('Name')}'. Enable it to restrict cross-trust access.</li>")
+                recommendations.append(f"<li><strong>Trust Relationship:</strong> Selective authentication is disabled for trust '{esc(trust.get('Name'))}'. Enable it to restrict cross-trust access.</li>")
         
         # Computer security recommendations
-        security_status = self.data.get('ComputerSecurityStatus', [])
-        computers_without_av = [c for c in security_status if c.get('Antivirus', {}).get('Online') and not c.get('Antivirus', {}).get('Installed')]
-        if computers_without_av:
-            recommendations.append(f"<li><strong>Antivirus:</strong> {len(computers_without_av)} online computers do not have antivirus installed. Install and maintain antivirus on all systems.</li>")
-        
-        computers_without_bitlocker = [c for c in security_status if c.get('BitLocker', {}).get('Online') and not c.get('BitLocker', {}).get('Enabled')]
-        if computers_without_bitlocker:
-            recommendations.append(f"<li><strong>BitLocker:</strong> {len(computers_without_bitlocker)} online computers do not have BitLocker enabled. Enable full disk encryption on all systems.</li>")
-        
-        computers_without_firewall = [c for c in security_status if c.get('Firewall', {}).get('Online') and not c.get('Firewall', {}).get('Enabled')]
-        if computers_without_firewall:
-            recommendations.append(f"<li><strong>Firewall:</strong> {len(computers_without_firewall)} online computers have firewall disabled. Enable Windows Firewall on all systems.</li>")
+        # One pass over the status records counts all three missing controls
+        computers_without_av = computers_without_bitlocker = computers_without_firewall = 0
+        for c in self.data.get('ComputerSecurityStatus', []):
+            av = c.get('Antivirus', {})
+            if av.get('Online') and not av.get('Installed'):
+                computers_without_av += 1
+            bitlocker = c.get('BitLocker', {})
+            if bitlocker.get('Online') and not bitlocker.get('Enabled'):
+                computers_without_bitlocker += 1
+            firewall = c.get('Firewall', {})
+            if firewall.get('Online') and not firewall.get('Enabled'):
+                computers_without_firewall += 1
+        
+        computer_findings = [
+            (computers_without_av, "<li><strong>Antivirus:</strong> {} online computers do not have antivirus installed. Install and maintain antivirus on all systems.</li>"),
+            (computers_without_bitlocker, "<li><strong>BitLocker:</strong> {} online computers do not have BitLocker enabled. Enable full disk encryption on all systems.</li>"),
+            (computers_without_firewall, "<li><strong>Firewall:</strong> {} online computers have firewall disabled. Enable Windows Firewall on all systems.</li>")
+        ]
+        recommendations.extend([message.format(count) for count, message in computer_findings if count > 0])
         
         # LDAP/SMB signing recommendations
         ldap_policy = self.data.get('LDAPPolicy')
@@ -3363,13 +2550,13 @@ class ADAuditReportGenerator:
         if domain_info:
             domain_mode = domain_info.get('DomainMode', '')
             if domain_mode and '2008' in domain_mode:
-                recommendations.append(f"<li><strong>Domain Mode:</strong> Domain is running in {domain_mode} mode. Consider upgrading to Windows Server 2016 or later for enhanced security features.</li>")
+                recommendations.append(f"<li><strong>Domain Mode:</strong> Domain is running in {esc(domain_mode)} mode. Consider upgrading to Windows Server 2016 or later for enhanced security features.</li>")
         
         forest_info = self.data.get('ForestInfo')
         if forest_info:
             forest_mode = forest_info.get('ForestMode', '')
             if forest_mode and '2008' in forest_mode:
-                recommendations.append(f"<li><strong>Forest Mode:</strong> Forest is running in {forest_mode} mode. Consider upgrading to Windows Server 2016 or later for enhanced security features.</li>")
+                recommendations.append(f"<li><strong>Forest Mode:</strong> Forest is running in {esc(forest_mode)} mode. Consider upgrading to Windows Server 2016 or later for enhanced security features.</li>")
         
         # Suspicious accounts
         suspicious = self.data.get('SuspiciousAccounts', [])
@@ -3393,132 +2580,178 @@ class ADAuditReportGenerator:
         
         # Certificate templates
         cert_templates = self.data.get('CertificateTemplates', [])
-        dangerous_templates = [t for t in cert_templates if not t.get('RequiresManagerApproval') and t.get('AutoEnrollment')]
+        dangerous_templates = sum(1 for t in cert_templates if not t.get('RequiresManagerApproval') and t.get('AutoEnrollment'))
         if dangerous_templates:
-            recommendations.append(f"<li><strong>Certificate Templates:</strong> {len(dangerous_templates)} certificate templates allow auto-enrollment without manager approval. This is a security risk.</li>")
+            recommendations.append(f"<li><strong>Certificate Templates:</strong> {dangerous_templates} certificate templates allow auto-enrollment without manager approval. This is a security risk.</li>")
         
         # Expired certificates
         cas = self.data.get('CertificateAuthorities', [])
-        expired_cas = [ca for ca in cas if ca.get('IsExpired')]
+        expired_cas = sum(1 for ca in cas if ca.get('IsExpired'))
         if expired_cas:
-            recommendations.append(f"<li><strong>Certificates:</strong> {len(expired_cas)} certificate authorities are expired. Renew or remove expired certificates.</li>")
+            recommendations.append(f"<li><strong>Certificates:</strong> {expired_cas} certificate authorities are expired. Renew or remove expired certificates.</li>")
         
         if not recommendations:
             recommendations.append("<li>No critical issues detected. Continue monitoring and maintain security best practices.</li>")
         
         return f"<ul>{''.join(recommendations)}</ul>"
     
-    def generate_html(self) -> str:
-        """Generate complete HTML report"""
+    def _iter_sections(self) -> Iterator[str]:
+        """Yield each non-empty report section, newline separated"""
+        return self._join_sections([
+            self._iter_graph_visualization,
+            self.generate_domain_info_table,
+            self.generate_password_policy_table,
+            self.generate_ldap_smb_policy_table,
+            self.generate_fine_grained_password_policies_table,
+            self.generate_kerberoast_table,
+            self.generate_delegation_table,
+            self.generate_encryption_table,
+            self.generate_privileged_accounts_table,
+            self.generate_suspicious_accounts_table,
+            self.generate_inactive_accounts_table,
+            self.generate_krbtgt_info,
+            self.generate_ntlm_info,
+            self.generate_failed_logons_table,
+            self.generate_domain_controllers_table,
+            self.generate_trust_relationships_table,
+            self.generate_security_groups_table,
+            self.generate_empty_groups_table,
+            self.generate_large_groups_table,
+            self.generate_certificate_authorities_table,
+            self.generate_certificate_templates_table,
+            self.generate_gpo_settings_table,
+            self.generate_gpo_issues_table,
+            self.generate_kerberos_policy_table,
+            self.generate_anonymous_access_table,
+            self.generate_nested_groups_table,
+            self.generate_outdated_computers_table,
+            self.generate_service_account_issues_table,
+            self.generate_smbv1_usage_table,
+            self.generate_rdp_winrm_table,
+            self.generate_event_log_settings_table,
+            self.generate_computer_security_status_table,
+            self._iter_user_table,
+            self._iter_computer_table,
+            self.generate_service_accounts_table
+        ])
+    
+    def _iter_summary_sections(self, full_href: str = '') -> Iterator[str]:
+        """Yield the scorecard sections: policies, DCs, trusts and attack path counts"""
+        return self._join_sections([
+            self.generate_domain_info_table,
+            lambda: self.generate_attack_paths_summary(full_href),
+            self.generate_password_policy_table,
+            self.generate_ldap_smb_policy_table,
+            self.generate_fine_grained_password_policies_table,
+            self.generate_krbtgt_info,
+            self.generate_domain_controllers_table,
+            self.generate_trust_relationships_table
+        ])
+    
+    @staticmethod
+    def _join_sections(sections: List[Callable[[], Any]]) -> Iterator[str]:
+        """Yield the output of each section generator, skipping empty ones"""
+        first = True
+        for generate in sections:
+            # Large tables stream their rows as chunks; other sections return one string
+            chunks = generate()
+            if isinstance(chunks, str):
+                if not chunks:
+                    continue
+                chunks = (chunks,)
+            if not first:
+                yield '\n'
+            yield from chunks
+            first = False
+    
+    def iter_html(self, summary: bool = False, full_href: str = '') -> Iterator[str]:
+        """Yield the complete HTML report in chunks.
+
+        With summary=True only the scorecard sections are rendered (see
+        _iter_summary_sections); full_href links it to the full report.
+        """
         self.calculate_risk_scores()
         overall_score, risk_class, risk_label = self.get_overall_risk_score()
         
-        stats = self.data.get('Statistics', {})
-        
-        # Generate all sections
-        sections = [
-            self.generate_graph_visualization(),
-            self.generate_domain_info_table(),
-            self.generate_password_policy_table(),
-            self.generate_ldap_smb_policy_table(),
-            self.generate_fine_grained_password_policies_table(),
-            self.generate_kerberoast_table(),
-            self.generate_delegation_table(),
-            self.generate_encryption_table(),
-            self.generate_privileged_accounts_table(),
-            self.generate_suspicious_accounts_table(),
-            self.generate_inactive_accounts_table(),
-            self.generate_krbtgt_info(),
-            self.generate_ntlm_info(),
-            self.generate_failed_logons_table(),
-            self.generate_domain_controllers_table(),
-            self.generate_trust_relationships_table(),
-            self.generate_security_groups_table(),
-            self.generate_empty_groups_table(),
-            self.generate_large_groups_table(),
-            self.generate_certificate_authorities_table(),
-            self.generate_certificate_templates_table(),
-            self.generate_gpo_settings_table(),
-            self.generate_gpo_issues_table(),
-            self.generate_kerberos_policy_table(),
-            self.generate_anonymous_access_table(),
-            self.generate_nested_groups_table(),
-            self.generate_outdated_computers_table(),
-            self.generate_service_account_issues_table(),
-            self.generate_smbv1_usage_table(),
-            self.generate_rdp_winrm_table(),
-            self.generate_event_log_settings_table(),
-            self.generate_computer_security_status_table(),
-            self.generate_user_table(),
-            self.generate_computer_table(),
-            self.generate_service_accounts_table()
-        ]
+        stats = self._stats
         
-        sections_html = '\n'.join([s for s in sections if s])
-        
-        return HTML_TEMPLATE.format(
-            domain=self.data.get('Domain', 'Unknown'),
-            timestamp=self.data.get('Timestamp', datetime.now().isoformat()),
-            overall_risk_score=overall_score,
-            overall_risk_class=risk_class,
-            overall_risk_label=risk_label,
-            total_users=stats.get('TotalUsers', 0),
-            total_computers=stats.get('TotalComputers', 0),
-            kerberoast_targets=stats.get('UsersWithSPNs', 0),
-            delegation_risks=stats.get('UsersWithDelegation', 0) + stats.get('ComputersWithDelegation', 0),
-            weak_encryption=len([u for u in self.data.get('Users', [])
-                            if any(enc in ['DES', 'RC4'] for enc in u.get('EncryptionTypes', []))
-                            or u.get('UseDESKeyOnly', False)]),
-            computers_checked=len(self.data.get('ComputerSecurityStatus', [])),
-            sections=sections_html,
-            recommendations=self.generate_recommendations(),
-            graph_data=''  # Graph data is embedded in the graph section HTML
-        )
-
-
-def export_csv(data: Dict[str, Any], output_path: str):
-    """Export data to CSV format"""
+        if self.inline_assets:
+            styles = f'<style>{load_asset("report.css")}</style>'
+            scripts = f'<script>\n{load_asset("report.js")}\n</script>'
+        else:
+            styles = '<link rel="stylesheet" href="libs/report.css">'
+            scripts = '<script src="libs/report.js"></script>'
+        
+        yield from iter_template({
+            'styles': styles,
+            'scripts': scripts,
+            'domain': esc(self.data.get('Domain', 'Unknown')),
+            'timestamp': esc(self.data.get('Timestamp') or datetime.now().isoformat()),
+            'overall_risk_score': overall_score,
+            'overall_risk_class': risk_class,
+            'overall_risk_label': risk_label,
+            'total_users': stats.get('TotalUsers', 0),
+            'total_computers': stats.get('TotalComputers', 0),
+            'kerberoast_targets': stats.get('UsersWithSPNs', 0),
+            'delegation_risks': stats.get('UsersWithDelegation', 0) + stats.get('ComputersWithDelegation', 0),
+            'weak_encryption': self.weak_encryption_count,
+            'computers_checked': len(self.data.get('ComputerSecurityStatus', [])),
+            'sections': self._iter_summary_sections(full_href) if summary else self._iter_sections(),
+            'recommendations': self.generate_recommendations()
+        })
+    
+    def write_html(self, fp: TextIO, summary: bool = False, full_href: str = '') -> None:
+        """Stream the HTML report to an open text file"""
+        fp.writelines(self.iter_html(summary, full_href))
+    
+    def generate_html(self, summary: bool = False, full_href: str = '') -> str:
+        """Generate complete HTML report"""
+        buf = io.StringIO()
+        self.write_html(buf, summary, full_href)
+        return buf.getvalue()
+
+
+def export_csv(data: Dict[str, Any], output_path: str, buffer_size: int = IO_BUFFER_SIZE):
+    """Export users and computers to <stem>_users.csv / <stem>_computers.csv next to output_path"""
     import csv
     
-    def get_member_of(user: Dict[str, Any]) -> List[str]:
-        """Helper function to safely get MemberOf list"""
-        member_of = user.get('MemberOf')
-        if member_of is None:
-            return []
-        if isinstance(member_of, list):
-            return member_of
-        return []
+    semi_join = '; '.join
+    comma_join = ', '.join
+    get_member_of = ADAuditReportGenerator._get_member_of
     
     # Export users
-    users_file = output_path.replace('.csv', '_users.csv')
-    with open(users_file, 'w', newline='', encoding='utf-8') as f:
-        writer = csv.DictWriter(f, fieldnames=[
+    output = Path(output_path)
+    users_file = output.with_name(f"{output.stem}_users.csv")
+    with open(users_file, 'w', newline='', encoding='utf-8', buffering=buffer_size) as f:
+        writer = csv.writer(f)
+        writer.writerow([
             'SamAccountName', 'DisplayName', 'Enabled', 'SPNs', 'PasswordLastSet',
             'DaysSincePasswordChange', 'PasswordNeverExpires', 'EncryptionTypes',
             'TrustedForDelegation', 'MemberOf', 'DaysSinceLastLogon'
         ])
-        writer.writeheader()
-        for user in data.get('Users', []):
-            row = user.copy()
-            row['SPNs'] = '; '.join(user.get('SPNs', []))
-            row['EncryptionTypes'] = ', '.join(user.get('EncryptionTypes', []))
-            row['MemberOf'] = ', '.join(get_member_of(user))
-            writer.writerow(row)
+        # Rows are tuples in header order; None and missing fields are written as empty cells
+        writer.writerows((
+            u.get('SamAccountName'), u.get('DisplayName'), u.get('Enabled'),
+            semi_join(u.get('SPNs') or ()), u.get('PasswordLastSet'),
+            u.get('DaysSincePasswordChange'), u.get('PasswordNeverExpires'),
+            comma_join(u.get('EncryptionTypes') or ()), u.get('TrustedForDelegation'),
+            comma_join(get_member_of(u)), u.get('DaysSinceLastLogon')
+        ) for u in data.get('Users', []))
     
     # Export computers
-    computers_file = output_path.replace('.csv', '_computers.csv')
-    with open(computers_file, 'w', newline='', encoding='utf-8') as f:
-        writer = csv.DictWriter(f, fieldnames=[
+    computers_file = output.with_name(f"{output.stem}_computers.csv")
+    with open(computers_file, 'w', newline='', encoding='utf-8', buffering=buffer_size) as f:
+        writer = csv.writer(f)
+        writer.writerow([
             'SamAccountName', 'OperatingSystem', 'Enabled', 'SPNs',
             'TrustedForDelegation', 'ConstrainedDelegation', 'EncryptionTypes'
         ])
-        writer.writeheader()
-        for computer in data.get('Computers', []):
-            row = computer.copy()
-            row['SPNs'] = '; '.join(computer.get('SPNs', []))
-            row['ConstrainedDelegation'] = '; '.join(computer.get('ConstrainedDelegation', []))
-            row['EncryptionTypes'] = ', '.join(computer.get('EncryptionTypes', []))
-            writer.writerow(row)
+        writer.writerows((
+            c.get('SamAccountName'), c.get('OperatingSystem'), c.get('Enabled'),
+            semi_join(c.get('SPNs') or ()), c.get('TrustedForDelegation'),
+            semi_join(c.get('ConstrainedDelegation') or ()),
+            comma_join(c.get('EncryptionTypes') or ())
+        ) for c in data.get('Computers', []))
     
     print(f"[+] CSV files exported: {users_file}, {computers_file}")
 
@@ -3533,14 +2766,21 @@ def main():
                        help='Also export CSV files')
     parser.add_argument('--json-export', action='store_true',
                        help='Also export processed JSON')
+    parser.add_argument('--inline-assets', action='store_true',
+                       help='Embed minified report CSS/JS in the HTML file')
+    parser.add_argument('--summary', action='store_true',
+                       help='Also write a lightweight summary report (policies, DCs, trusts, attack paths)')
+    parser.add_argument('--io-buffer-size', type=int, default=IO_BUFFER_SIZE,
+                       help=f'Write buffer size in bytes for output files (default: {IO_BUFFER_SIZE}, minimum: {MIN_IO_BUFFER_SIZE})')
     
     args = parser.parse_args()
+    buffer_size = max(args.io_buffer_size, MIN_IO_BUFFER_SIZE)
     
     # Load JSON data
     try:
-        # Use utf-8-sig to handle UTF-8 with or without BOM
-        with open(args.input, 'r', encoding='utf-8-sig') as f:
-            data = json.load(f)
+        # Parse the raw bytes: json detects UTF-8 (with or without BOM) and UTF-16/32
+        # itself, which skips a separate text decode pass over large exports
+        data = json.loads(Path(args.input).read_bytes())
     except FileNotFoundError:
         print(f"[-] Error: Input file '{args.input}' not found.")
         print(f"    Run Get-ADAudit.ps1 first to generate audit data.")
@@ -3551,22 +2791,30 @@ def main():
     
     # Generate report
     print("[*] Generating HTML report...")
-    generator = ADAuditReportGenerator(data)
-    html = generator.generate_html()
+    generator = ADAuditReportGenerator(data, inline_assets=args.inline_assets)
     
-    # Write HTML report
-    with open(args.output, 'w', encoding='utf-8') as f:
-        f.write(html)
+    # Stream HTML report straight to disk
+    with open(args.output, 'w', encoding='utf-8', buffering=buffer_size) as f:
+        generator.write_html(f)
     print(f"[+] HTML report generated: {args.output}")
     
+    # Write summary report if requested, linking back to the full report
+    if args.summary:
+        output = Path(args.output)
+        summary_output = output.with_name(f"{output.stem}_summary{output.suffix}")
+        with open(summary_output, 'w', encoding='utf-8', buffering=buffer_size) as f:
+            generator.write_html(f, summary=True, full_href=output.name)
+        print(f"[+] Summary report generated: {summary_output}")
+    
     # Export CSV if requested
     if args.csv:
-        export_csv(data, args.output)
+        export_csv(data, args.output, buffer_size)
     
     # Export JSON if requested
     if args.json_export:
-        json_output = args.output.replace('.html', '_processed.json')
-        with open(json_output, 'w', encoding='utf-8') as f:
+        output = Path(args.output)
+        json_output = output.with_name(f"{output.stem}_processed.json")
+        with open(json_output, 'w', encoding='utf-8', buffering=buffer_size) as f:
             json.dump(data, f, indent=2, ensure_ascii=False)
         print(f"[+] Processed JSON exported: {json_output}")
 
@@ -0,0 +1,183 @@
+// Collapsible sections
+document.querySelectorAll('.section-header').forEach(header => {
+    header.addEventListener('click', function() {
+        const section = this.parentElement;
+        section.classList.toggle('collapsed');
+
+        // Reinitialize graph if graph section is expanded
+        if (section.id === 'graph-section' && !section.classList.contains('collapsed')) {
+            setTimeout(initGraph, 100);
+        }
+    });
+});
+
+// BloodHound-style graph visualization
+function initGraph() {
+    if (typeof graphNodes === 'undefined' || typeof graphEdges === 'undefined') {
+        return;
+    }
+
+    const container = document.getElementById('graph-container');
+    if (!container) return;
+
+    const data = {
+        nodes: new vis.DataSet(graphNodes),
+        edges: new vis.DataSet(graphEdges)
+    };
+
+    const options = {
+        nodes: {
+            shape: 'dot',
+            size: 16,
+            font: {
+                size: 12,
+                face: 'Segoe UI'
+            },
+            borderWidth: 2,
+            shadow: true
+        },
+        edges: {
+            width: 2,
+            color: { color: '#848484' },
+            smooth: {
+                type: 'continuous',
+                roundness: 0.5
+            },
+            arrows: {
+                to: { enabled: true, scaleFactor: 0.8 }
+            },
+            font: {
+                size: 10,
+                align: 'middle'
+            }
+        },
+        physics: {
+            enabled: true,
+            stabilization: {
+                iterations: 200
+            },
+            barnesHut: {
+                gravitationalConstant: -2000,
+                centralGravity: 0.1,
+                springLength: 200,
+                springConstant: 0.04,
+                damping: 0.09
+            }
+        },
+        interaction: {
+            hover: true,
+            tooltipDelay: 200,
+            zoomView: true,
+            dragView: true
+        }
+    };
+
+    const network = new vis.Network(container, data, options);
+
+    // Filter controls
+    const filterButtons = document.querySelectorAll('.graph-filter-btn');
+    filterButtons.forEach(btn => {
+        btn.addEventListener('click', function() {
+            const filterType = this.dataset.filter;
+            filterButtons.forEach(b => b.classList.remove('active'));
+            this.classList.add('active');
+
+            let visibleNodes, visibleEdges;
+
+            if (filterType === 'attack-paths') {
+                // Show nodes involved in attack paths
+                const pathNodeIds = new Set();
+                if (typeof attackPaths !== 'undefined') {
+                    attackPaths.forEach(path => {
+                        path.path.forEach(nodeId => pathNodeIds.add(nodeId));
+                    });
+                }
+                visibleNodes = graphNodes.filter(n => pathNodeIds.has(n.id)).map(n => n.id);
+                visibleEdges = graphEdges.filter(edge => {
+                    return visibleNodes.includes(edge.from) && visibleNodes.includes(edge.to);
+                });
+                // Highlight attack path edges
+                visibleEdges.forEach(edge => {
+                    if (edge.attackPath) {
+                        edge.width = 4;
+                        edge.color = '#dc3545';
+                    }
+                });
+            } else {
+                visibleNodes = graphNodes.filter(node => {
+                    if (filterType === 'all') return true;
+                    if (filterType === 'high-risk') {
+                        return node.risk === 'high' || node.group === 'Domain Admins' || node.group === 'Enterprise Admins';
+                    }
+                    return node.type === filterType;
+                }).map(n => n.id);
+
+                visibleEdges = graphEdges.filter(edge => {
+                    return visibleNodes.includes(edge.from) && visibleNodes.includes(edge.to);
+                });
+            }
+
+            data.nodes.update(graphNodes.filter(n => visibleNodes.includes(n.id)));
+            data.edges.update(visibleEdges);
+        });
+    });
+
+    // Node click handler - show info panel instead of alert
+    network.on('click', function(params) {
+        const panel = document.getElementById('node-info-panel');
+        const titleEl = document.getElementById('node-info-title');
+        const contentEl = document.getElementById('node-info-content');
+
+        if (params.nodes.length > 0) {
+            const nodeId = params.nodes[0];
+            const node = graphNodes.find(n => n.id === nodeId);
+            if (node) {
+                titleEl.textContent = node.label;
+                let html = '';
+                html += '<div class="info-row"><span class="info-label">Type:</span><span class="info-value">' + node.type + '</span></div>';
+                if (node.group) {
+                    html += '<div class="info-row"><span class="info-label">Group:</span><span class="info-value">' + node.group + '</span></div>';
+                }
+                if (node.risk) {
+                    const riskColor = node.risk === 'high' ? '#dc3545' : node.risk === 'medium' ? '#ffc107' : '#e74c3c';
+                    html += '<div class="info-row"><span class="info-label">Risk:</span><span class="info-value" style="color: ' + riskColor + '; font-weight: 600;">' + node.risk.toUpperCase() + '</span></div>';
+                }
+                if (node.spns !== undefined && node.spns > 0) {
+                    html += '<div class="info-row"><span class="info-label">SPNs:</span><span class="info-value">' + node.spns + '</span></div>';
+                }
+                if (node.type === 'user' && typeof userData !== 'undefined') {
+                    // Find user in data to show more details
+                    const user = userData.find(u => 'user_' + u.SamAccountName === nodeId);
+                    if (user) {
+                        if (user.PasswordLastSet) {
+                            html += '<div class="info-row"><span class="info-label">Password Last Set:</span><span class="info-value">' + user.PasswordLastSet + '</span></div>';
+                        }
+                        if (user.TrustedForDelegation || user.TrustedToAuthForDelegation) {
+                            html += '<div class="info-row"><span class="info-label">Delegation:</span><span class="info-value" style="color: #dc3545;">Enabled</span></div>';
+                        }
+                        if (user.SPNs && user.SPNs.length > 0) {
+                            html += '<div class="info-row"><span class="info-label">SPN Count:</span><span class="info-value">' + user.SPNs.length + '</span></div>';
+                        }
+                    }
+                }
+                contentEl.innerHTML = html;
+                panel.classList.add('visible');
+            }
+        } else {
+            // Click on empty space - hide panel
+            panel.classList.remove('visible');
+        }
+    });
+
+    // Hide panel when clicking outside
+    network.on('oncontext', function(params) {
+        document.getElementById('node-info-panel').classList.remove('visible');
+    });
+}
+
+// Initialize graph when page loads
+if (document.readyState === 'loading') {
+    document.addEventListener('DOMContentLoaded', initGraph);
+} else {
+    initGraph();
+}